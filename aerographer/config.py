@@ -19,13 +19,12 @@ Central location for global configuration values.
 """
 
 import os
-import json
-from pathlib import Path
-from typing import Any
+from dataclasses import dataclass
+from itertools import product
 
 
-def separate(text: str | None, delimiter: str = ',') -> list[str | None]:
-    """Return list from comma seperated string.
+def separate(text: str | None, delimiter: str = ',') -> tuple[str | None, ...]:
+    """Return tuple from comma seperated string.
 
     Separates the provided string using the provided as delimiter and
     remove whitespace.
@@ -35,26 +34,51 @@ def separate(text: str | None, delimiter: str = ',') -> list[str | None]:
         delimiter (str): (optional) character to use as delimiter.
 
     Returns:
-        A list of strings from the provided string.
+        A tuple of strings from the provided string.
     """
     if text is None:
-        return [None]
-    return [s.strip() for s in text.split(sep=delimiter)]
+        return (None,)
+    return tuple(s.strip() for s in text.split(sep=delimiter))
+
+
+@dataclass(frozen=True, slots=True)
+class ACCOUNT:
+    """Dataclass representing an account to scan.
+
+    Dataclass that contains the properties used to build scan
+    sessions for an account.
+
+    Attributes:
+        profile (str): (class attribute) Profile name of account.
+        regions (tuple[str]): (class attribute) Regions to scan.
+        role (str): (class attribute) Role to assume in account.
+    """
+
+    profile: str | None
+    regions: tuple[str | None, ...]
+    role: str | None
 
 
 LOGGING_LEVEL: str = os.getenv('AG_LOGGING_LEVEL', 'warn')
-PROFILES: list[str | None] = separate(os.getenv('AG_AWS_PROFILES', None))
-ROLES: list[str | None] = separate(os.getenv('AG_AWS_ROLES', None))
-REGIONS: list[str | None] = separate(
+PROFILES: tuple[str | None, ...] = separate(os.getenv('AG_AWS_PROFILES', None))
+ROLES: tuple[str | None, ...] = separate(os.getenv('AG_AWS_ROLES', None))
+REGIONS: tuple[str | None, ...] = separate(
     os.getenv('AG_AWS_REGIONS', os.getenv('AWS_REGION', None))
 )
+SCAN_CONCURRENCY: int = max(1, int(os.getenv('AG_SCAN_CONCURRENCY', '32')))
+CONTEXT_CONCURRENCY: int = max(1, int(os.getenv('AG_CONTEXT_CONCURRENCY', '16')))
+MAX_POOL_CONNECTIONS: int = max(1, int(os.getenv('AG_MAX_POOL_CONNECTIONS', '64')))
+MAX_ATTEMPTS: int = max(1, int(os.getenv('AG_MAX_ATTEMPTS', '10')))
+EVAL_WORKERS: int = max(1, int(os.getenv('AG_EVAL_WORKERS', '1')))
+FORCE_GC: bool = os.getenv('AG_FORCE_GC', '0') == '1'
 
 # internal properties
 MODULE_NAME = __name__.split('.', maxsplit=1)[0]
-MODULE_PATH: str = str(Path(__file__).parent.absolute())
+MODULE_PATH: str = os.path.dirname(os.path.abspath(__file__))
+SERVICE_MODULE: str = f'{MODULE_NAME}.service'
+SERVICE_PREFIX: str = f'{SERVICE_MODULE}.'
 
-ACCOUNTS: list[dict[str, Any]] = [
-    {'profile': profile, 'regions': REGIONS, 'role': role}
-    for profile in PROFILES
-    for role in ROLES
+ACCOUNTS: list[ACCOUNT] = [
+    ACCOUNT(profile=profile, regions=REGIONS, role=role)
+    for profile, role in product(PROFILES, ROLES)
 ]
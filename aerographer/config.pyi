@@ -15,15 +15,29 @@ limitations under the License.
 
 """Type stub file"""
 
-from typing import Any
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
+class ACCOUNT:
+    profile: str | None
+    regions: tuple[str | None, ...]
+    role: str | None
 
 LOGGING_LEVEL: str
-PROFILES: list[str | None]
-ROLES: list[str | None]
-REGIONS: list[str | None]
+PROFILES: tuple[str | None, ...]
+ROLES: tuple[str | None, ...]
+REGIONS: tuple[str | None, ...]
+SCAN_CONCURRENCY: int
+CONTEXT_CONCURRENCY: int
+MAX_POOL_CONNECTIONS: int
+MAX_ATTEMPTS: int
+EVAL_WORKERS: int
+FORCE_GC: bool
 
 MODULE_NAME: str
 MODULE_PATH: str
-ACCOUNTS: list[dict[str, Any]]
+SERVICE_MODULE: str
+SERVICE_PREFIX: str
+ACCOUNTS: list[ACCOUNT]
 
-def separate(text: str, regex: str = ...) -> list[str]: ...
\ No newline at end of file
+def separate(text: str | None, delimiter: str = ...) -> tuple[str | None, ...]: ...
\ No newline at end of file
@@ -34,26 +34,68 @@ with the aerographer module.
 import sys
 import gc
 import asyncio
-from datetime import datetime
-from typing import Any
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import chain, product
+from typing import Any, Iterable, Sequence, TYPE_CHECKING
 
 from botocore.exceptions import ClientError  # type: ignore
 
 from aerographer.scan import build_contexts, scan_results
-from aerographer.survey import SURVEY, Survey
 from aerographer.scan.parallel import async_scan
-from aerographer.crawler.factories import apply_external_evaluations, import_crawlers
 from aerographer.crawler.generic import GenericCrawler
-from aerographer.logger import logger
-from aerographer.config import PROFILES, ROLES, REGIONS, MODULE_NAME
+from aerographer.logger import logger, LOG_LEVEL
+from aerographer.config import (
+    ACCOUNT,
+    PROFILES,
+    ROLES,
+    REGIONS,
+    EVAL_WORKERS,
+    FORCE_GC,
+    SCAN_CONCURRENCY,
+    SERVICE_MODULE,
+    SERVICE_PREFIX,
+)
 from aerographer.exceptions import (
     CrawlerNotFoundError,
     FailedCrawlerScanError,
 )
 
+if TYPE_CHECKING:
+    from aerographer.survey import Survey
+
+# survey and factory imports are deferred to the functions that use them, keeping
+# them off the import path of `aerographer.crawler`.
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported module attributes.
+
+    Keeps `SURVEY` importable from `aerographer.crawler` without loading
+    `aerographer.survey` at import time.
+
+    Args:
+        name (str): attribute name.
+
+    Return:
+        Attribute value.
+
+    Raises:
+        AttributeError: attribute not found.
+    """
+
+    if name == 'SURVEY':
+        from aerographer.survey import SURVEY
+
+        return SURVEY
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 def get_crawlers(
-    services: set[str],
+    services: Iterable[str],
     skip: list[str] | None = None,
     quiet_skip: bool = False,
 ) -> list[GenericCrawler]:
@@ -61,7 +103,8 @@ def get_crawlers(
 
     Returns a list of all web crawler classes ready to start scanning
     from a list of service paths. Skip sub paths by providing `skip`
-    parameter.
+    parameter. Crawlers are returned in the order services are provided.
+    Results are cached per services and skip paths.
 
     Args:
         services (str|list): Service path, or list of service paths.
@@ -72,34 +115,62 @@ def get_crawlers(
         List of web crawler class.
     """
 
-    # safe default to []
-    skip = skip or []
-
-    # format services and skip names properly to further use
-    services = set(
-        f'{MODULE_NAME}.service.{service}'
-        if not service.startswith(f'{MODULE_NAME}.service')
-        else service
-        for service in services
+    # format services and skip names properly to further use. dict.fromkeys
+    # removes duplicates while keeping the requested service order.
+    formatted_services = tuple(
+        dict.fromkeys(
+            service if service.startswith(SERVICE_MODULE) else SERVICE_PREFIX + service
+            for service in services
+        )
     )
 
-    skip = [
-        f'{MODULE_NAME}.service.{s}'
-        if not s.startswith('{MODULE_NAME}.service.')
-        else s
-        for s in skip
-    ]
+    formatted_skip = frozenset(
+        s if s.startswith(SERVICE_MODULE) else SERVICE_PREFIX + s for s in skip or ()
+    )
 
     # return crawlers from service paths
     try:
-        return sum(
-            [import_crawlers(service, skip, quiet_skip) for service in services], []
+        return list(
+            _get_crawlers_cached(formatted_services, formatted_skip, quiet_skip)
         )
     except CrawlerNotFoundError as err:
         logger.error(err)
         sys.exit(1)
 
 
+@lru_cache(maxsize=256)
+def _get_crawlers_cached(
+    services: tuple[str, ...], skip: frozenset[str], quiet_skip: bool
+) -> tuple[GenericCrawler, ...]:
+    """Get cached tuple of web crawlers.
+
+    Memoized backend of `get_crawlers`. Takes already formatted, hashable
+    service and skip paths. Use `_get_crawlers_cached.cache_clear()` to reset.
+
+    Args:
+        services (tuple): Formatted service paths.
+        skip (frozenset): Formatted service paths to skip.
+        quiet_skip (bool): Supresses skip debug messages.
+
+    Return:
+        Tuple of web crawler classes.
+
+    Raises:
+        CrawlerNotFoundError: failed to get GenericCrawler class.
+    """
+
+    from aerographer.crawler.factories import import_crawlers
+
+    # overlapping service paths (e.g. `kms` and `kms.key`) yield a crawler once
+    return tuple(
+        dict.fromkeys(
+            chain.from_iterable(
+                import_crawlers(service, skip, quiet_skip) for service in services
+            )
+        )
+    )
+
+
 def get_crawler_includes(crawlers: list[GenericCrawler]) -> list[GenericCrawler]:
     """Get include crawlers.
 
@@ -111,21 +182,28 @@ def get_crawler_includes(crawlers: list[GenericCrawler]) -> list[GenericCrawler]
     Return:
         List of web crawler classes.
     """
-    provided = [f'{crawler.serviceType}.{crawler.resourceName}' for crawler in crawlers]
-    includes = set()
-    for crawler in crawlers:
-        includes.update(crawler.INCLUDE)
-    include_crawlers = [
-        crawler
-        for crawler in get_crawlers(services=includes, skip=provided, quiet_skip=True)
-        if crawlers and crawler.state == 'initialized'
-    ]
-
-    # recursively get include crawlers until empty list is returned, meaning all have been retrieved.
-    if include_crawlers:
-        include_crawlers.extend(
-            get_crawler_includes(list(set(include_crawlers + crawlers)))
-        )
+    seen = {crawler._include_key for crawler in crawlers}
+    include_crawlers: list[GenericCrawler] = []
+    pending = crawlers
+
+    # resolve includes level by level until no new crawlers are found. crawlers
+    # already seen are skipped, so each include is only resolved once.
+    while pending:
+        includes = set(chain.from_iterable(crawler.INCLUDE for crawler in pending))
+        # exact service.resource paths already resolved need no further lookup
+        includes.difference_update(seen)
+        if not includes:
+            break
+
+        pending = [
+            crawler
+            for crawler in get_crawlers(
+                services=includes, skip=list(seen), quiet_skip=True
+            )
+            if crawler._include_key not in seen and crawler.state == 'initialized'
+        ]
+        seen.update(crawler._include_key for crawler in pending)
+        include_crawlers.extend(pending)
 
     return include_crawlers
 
@@ -144,17 +222,40 @@ async def deploy_crawlers(
         FailedCrawlerScanError: web crawler scan failed
     """
     logger.debug('Gathering included crawlers...')
-    for name, includes in [
-        (crawler.__name__, crawler.INCLUDE) for crawler in crawlers  # type:ignore
-    ]:
-        logger.trace('%s: %s', name, ','.join(includes))  # type: ignore
+    if logger.isEnabledFor(LOG_LEVEL.TRACE):
+        for crawler in crawlers:
+            logger.trace('%s: %s', crawler.__name__, ','.join(crawler.INCLUDE))  # type: ignore
 
     include_crawlers = get_crawler_includes(crawlers=crawlers)
 
+    # bound the number of crawlers scanning at once. the semaphore is local to
+    # this call as custom paginators deploy their own includes while holding a slot.
+    semaphore = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    async def _bounded_scan(crawler: GenericCrawler) -> None:
+        async with semaphore:
+            await async_scan(crawler)
+
+    tasks = [
+        asyncio.ensure_future(_bounded_scan(s))
+        for s in chain(crawlers, include_crawlers)
+    ]
+    if not tasks:
+        return
+
+    # stop on first failure, any scans still running are cancelled
     try:
-        await asyncio.gather(*(async_scan(s) for s in crawlers + include_crawlers))
-    except ClientError as err:
-        raise FailedCrawlerScanError(err) from err
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks:
+            task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    for task in tasks:
+        if not task.cancelled() and (err := task.exception()):
+            if isinstance(err, ClientError):
+                raise FailedCrawlerScanError(err) from err
+            raise err
 
 
 class Crawler:
@@ -167,7 +268,7 @@ class Crawler:
         services (str|list[str]): (optional) Target service(s). Default: all services.
         skip (str|list[str]): (optional) Service(s) to skip. Default: []
         profiles (list[str]): (optional) AWS profile(s) for accounts to scan. Default ['default'].
-        regions (list[str]): (optional) AWS region(s) to scan. Default ['us-east-1'].
+        regions (Sequence[str]): (optional) AWS region(s) to scan. Default ['us-east-1'].
         role (str): (optional) AWS role name to assume in each account.
         evaluations (list[str]): (optional) Module containing evalution functions to run.
         parameters (list[dict]): (optional) List of paramter options to use for scan.
@@ -183,16 +284,17 @@ class Crawler:
         skip: str | list[str] | None = None,  # safe default for list
         profiles: list[str] | None = None,  # safe default for list
         roles: list[str] | None = None,  # safe default for list
-        regions: list[str] | None = None,  # safe default for list
+        regions: Sequence[str] | None = None,  # safe default for list
         evaluations: list[str] | None = None,  # safe default for list
         parameters: list[dict[str, dict]] | None = None,
     ) -> None:
         """Class initializer."""
+        from aerographer.crawler.factories import apply_external_evaluations
 
         if isinstance(services, str):
             self.services = [services]
         else:
-            self.services = services or [f'{MODULE_NAME}.service']
+            self.services = services or [SERVICE_MODULE]
 
         if isinstance(skip, str):
             self.skip = [skip]
@@ -201,7 +303,8 @@ class Crawler:
 
         self.profiles = profiles or PROFILES
         self.roles = roles or ROLES
-        self.regions = regions or REGIONS
+        # one immutable regions tuple is shared by every account
+        self.regions = tuple(regions) if regions else REGIONS
         self.parameters = parameters or []
 
         # apply provided external evaluations to web crawlers
@@ -209,11 +312,8 @@ class Crawler:
 
         # initialize and get web crawlers
         try:
-            # import service module to initialize crawler classes
-            import aerographer.service
-
             logger.debug('Gathering crawlers for %s', ', '.join(self.services))
-            self.crawlers = get_crawlers(set(self.services), self.skip)
+            self.crawlers = get_crawlers(self.services, self.skip)
             if self.crawlers is None:
                 logger.error('No crawlers found for %s', self.services)
                 sys.exit(1)
@@ -223,73 +323,83 @@ class Crawler:
 
         # TODO: add to README
         # set provided scan parameters
+        crawler_index = {
+            (crawler.serviceType.lower(), crawler.resourceName): crawler
+            for crawler in self.crawlers
+        }
         for k, v in (
             (k, v) for parameter in self.parameters for k, v in parameter.items()
         ):
             service, resource = k.split('.')
-            crawler = next(
-                (
-                    crawler
-                    for crawler in self.crawlers
-                    if crawler.serviceType.lower() == service
-                    and crawler.resourceName == resource
-                ),
-                None,
-            )
+            crawler = crawler_index.get((service, resource))
             if crawler:
                 crawler.scanParameters = v
 
         # initialize contexts
         self.accounts = [
-            {'profile': profile, 'regions': self.regions, 'role': role}
-            for profile in self.profiles
-            for role in self.roles
+            ACCOUNT(profile=profile, regions=self.regions, role=role)
+            for profile, role in product(self.profiles, self.roles)
         ]
 
-    def scan(self) -> Survey:
+    @cached_property
+    def _service_types(self) -> frozenset[str]:
+        """Service types of all web crawlers.
+
+        Computed once per instance. Drop with `del self._service_types`
+        if `self.crawlers` is changed after first use.
+
+        Return:
+            Frozenset of crawler service types.
+        """
+        return frozenset(crawler.serviceType for crawler in self.crawlers)
+
+    def scan(self) -> 'Survey':
         """Performs scan and evaluations of all web crawlers.
 
         Triggers each web crawler to scan target resource and perform any
-        present evaluations. Forces garabage cleanup to after scan as scan
-        can consume a lot of memory.
+        present evaluations. A full garbage collection after the scan can be
+        forced with `AG_FORCE_GC=1`; it can release memory sooner on large
+        scans, but pauses for a full walk of all tracked objects.
 
         Return:
             Dictionary containing all class instances created by scan.
         """
+        from aerographer.survey import SURVEY, Survey
 
         logger.info("Building scan sessions...")
-        start = datetime.now()
+        start = time.perf_counter_ns()
         build_contexts(
             self.accounts,
-            services=set([crawler.serviceType for crawler in self.crawlers]),
+            services=self._service_types,
         )
         logger.trace(  # type: ignore
-            'Session initialization time: %s', datetime.now() - start
+            'Session initialization time: %.3f ms',
+            (time.perf_counter_ns() - start) / 1e6,
         )
 
         try:
-            # run scan and force GC
-            start = datetime.now()
+            # run scan and optionally force GC
+            start = time.perf_counter_ns()
             asyncio.run(deploy_crawlers(crawlers=self.crawlers))
-            logger.trace('Scan time: %s', datetime.now() - start)  # type:ignore
-            gc.collect()
+            logger.trace(  # type: ignore
+                'Scan time: %.3f ms', (time.perf_counter_ns() - start) / 1e6
+            )
+            if FORCE_GC:
+                gc.collect()
         except FailedCrawlerScanError as err:
             logger.error('Scan failed -- %s', err)
             sys.exit(1)
 
         # build new dictionary that only contains class instances included in targeted scans
         # this is so instances created to fulfill dependancy scan requirements are not returned
-        RETURN_COLLECTION: dict[str, Any] = {}  # pylint: disable=invalid-name
+        RETURN_COLLECTION: dict[str, dict[str, Any]] = defaultdict(dict)  # pylint: disable=invalid-name
 
         # TODO: this needs rework as it does not strip unrequested resources from return collection. use kms.key_rotation to observe.
         # this needs to return evaluation includes, but not internal includes.
         for crawler in self.crawlers:
-            if crawler.serviceType not in RETURN_COLLECTION:
-                RETURN_COLLECTION[crawler.serviceType] = {}
-
-            RETURN_COLLECTION[crawler.serviceType][crawler.resourceName] = scan_results[
-                crawler.serviceType
-            ][crawler.resourceName]
+            service_type = crawler.serviceType
+            resources = scan_results[service_type][crawler.resourceName]
+            RETURN_COLLECTION[service_type][crawler.resourceName] = resources
 
             # for resource in RETURN_COLLECTION[crawler.serviceType][
             #     crawler.resourceName
@@ -317,8 +427,23 @@ class Crawler:
                 for asset in assets.values():
                     r._add_resource(asset)
 
-        for resource in SURVEY.get_resources():
-            resource.run_evaluations(internal_survey)
+        # evaluate all published resources, including those of earlier scans
+        survey_resources: list[GenericCrawler] = SURVEY.get_resources().get()
+
+        # evaluations are independent per resource, so they can optionally be
+        # spread over a thread pool. serial by default to keep exception order.
+        workers = min(EVAL_WORKERS, len(survey_resources))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(
+                    executor.map(
+                        lambda resource: resource.run_evaluations(internal_survey),
+                        survey_resources,
+                    )
+                )
+        else:
+            for resource in survey_resources:
+                resource.run_evaluations(internal_survey)
 
         SURVEY._publish()
         return SURVEY
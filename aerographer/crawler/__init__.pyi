@@ -15,7 +15,8 @@ limitations under the License.
 
 """Type stub file"""
 
-from typing import Any
+from functools import cached_property
+from typing import Any, Iterable, Sequence
 
 from aerographer.survey import Survey
 from aerographer.crawler.generic import GenericCrawler
@@ -27,7 +28,7 @@ class Crawler:
     skip: str | list[str] | None
     profiles: list[str] | None
     roles: list[str] | None
-    regions: list[str] | None
+    regions: tuple[str | None, ...]
     evaluations: list[str] | None
     crawlers: GenericCrawler
 
@@ -37,16 +38,21 @@ class Crawler:
         skip: str | list[str] | None = ...,
         profiles: list[str | None] = ...,
         roles: list[str] | None = ...,
-        regions: list[str | None] = ...,
+        regions: Sequence[str | None] | None = ...,
         evaluations: list[str] | None = ...,
         parameters: list[dict[str,dict]] | None = ...,
     ) -> None: ...
     def _apply_external_evaluations(self) -> None: ...
+    @cached_property
+    def _service_types(self) -> frozenset[str]: ...
     def scan(self) -> Survey: ...
 
 def get_crawlers(
-    services: set[str], skip: list[str] | None = ...
+    services: Iterable[str], skip: list[str] | None = ..., quiet_skip: bool = ...
 ) -> list[GenericCrawler]: ...
+def _get_crawlers_cached(
+    services: tuple[str, ...], skip: frozenset[str], quiet_skip: bool
+) -> tuple[GenericCrawler, ...]: ...
 def get_crawler_includes(crawlers: list[GenericCrawler]) -> list[GenericCrawler]: ...
 async def deploy_crawlers(
     crawlers: list[GenericCrawler],
@@ -23,16 +23,22 @@ external evaulation methods. Not meant for external use.
 import os
 import sys
 import importlib
-import pkgutil
-from dataclasses import make_dataclass, field, is_dataclass, asdict
+from copy import deepcopy
+from functools import lru_cache
 from importlib.util import module_from_spec, spec_from_file_location
-from inspect import getmembers, isclass, isfunction
+from inspect import isclass, isfunction
+from keyword import iskeyword
+from operator import attrgetter
 from types import ModuleType, FunctionType
-from typing import Any, no_type_check
+from typing import Any, Collection, Generator
 
-from aerographer.crawler.generic import GenericCrawler, GenericMetadata
+from aerographer.crawler.generic import (
+    GenericCrawler,
+    GenericMetadata,
+    _metadata_asdict,
+)
 from aerographer.logger import logger
-from aerographer.config import MODULE_NAME
+from aerographer.config import SERVICE_PREFIX
 from aerographer.exceptions import (
     InvalidServiceDefinitionError,
     CrawlerNotFoundError,
@@ -42,10 +48,27 @@ from aerographer.exceptions import (
 )
 
 _CRAWLER_CACHE: dict[str, GenericCrawler] = {}
+_SUBMODULES_CACHE: dict[str, tuple[str, ...]] = {}
+_METADATA_BASE_CACHE: dict[tuple[tuple[str, Any], ...], type] = {}
+_EXTERNAL_EVALUATIONS_CACHE: dict[str, dict[str, Any]] = {}
+_GENERIC_CRAWLER_ATTRIBUTES = frozenset(dir(GenericCrawler))
+# default marker for nested metadata attributes in generated __init__ methods
+_MISSING = object()
+_REQUIRED_DEFINITION_ATTRIBUTES = frozenset(
+    (
+        'globalService',
+        'resourceType',
+        'idAttribute',
+        'paginator',
+        'page_marker',
+        'scanParameters',
+        'responseSchema',
+    )
+)
 
 
 def import_crawlers(
-    path: str, skip: list[str] | None = None, quiet_skip: bool = False
+    path: str, skip: Collection[str] | None = None, quiet_skip: bool = False
 ) -> list[GenericCrawler]:
     """Get crawler class.
 
@@ -53,7 +76,7 @@ def import_crawlers(
 
     Args:
         service (str): name of service to get web crawlers for.
-        skip (list[str]): service paths to skip.
+        skip (Collection[str]): service paths to skip.
         quiet_skip (bool): (Optional) Supresses skip debug messages. Defaults to `False`.
 
     Return:
@@ -63,13 +86,12 @@ def import_crawlers(
         CrawlerNotFoundError: failed to get GenericCrawler class.
     """
 
-    skip = skip or []
+    # frozenset() returns frozenset arguments as-is, so recursion reuses one set
+    skip = frozenset(skip or ())
     crawlers: list[GenericCrawler] = []
 
     # skip any modules included in skip list, if service or service.resource match exactly
-    if any(substring == path.rsplit('.', 1)[0] for substring in skip) or any(
-        substring == path for substring in skip
-    ):
+    if path in skip or path.rsplit('.', 1)[0] in skip:
         if not quiet_skip:
             logger.debug('Skipping submodule %s.', path)
         return []
@@ -88,29 +110,104 @@ def import_crawlers(
 
         # search for any submodules
         if getattr(module, '__path__', None):
-            for _, sub_module_name, is_pkg in pkgutil.walk_packages(
-                module.__path__, module.__name__ + '.'
-            ):
-                if not is_pkg:
-                    # recurively load submodules
-                    crawlers.extend(
-                        import_crawlers(
-                            path=sub_module_name, skip=skip, quiet_skip=quiet_skip
-                        )
+            for sub_module_name in _walk_submodules(module):
+                # recurively load submodules
+                crawlers.extend(
+                    import_crawlers(
+                        path=sub_module_name, skip=skip, quiet_skip=quiet_skip
                     )
+                )
 
         # no submodules, gather classes from this module
         else:
             try:
                 crawler = _get_crawler_class(module)
-                _CRAWLER_CACHE[path] = crawler
-                crawlers.append(crawler)
-            except CrawlerNotFoundError as err:
-                raise CrawlerNotFoundError(f'Failed to load {path}.') from err
+            except CrawlerNotFoundError:
+                # crawler classes are only built once their resource is requested
+                crawler = initialize_resource(module)
+            _CRAWLER_CACHE[path] = crawler
+            crawlers.append(crawler)
 
     return crawlers
 
 
+def initialize_resource(module: ModuleType) -> GenericCrawler:
+    """Initialize web crawler classes for resource module.
+
+    Builds web crawler class and metadata classes from the service and
+    resource definitions of provided resource module, and attaches the
+    web crawler class to the module.
+
+    Args:
+        module (ModuleType): Resource module to initialize.
+
+    Return:
+        New web crawler class.
+
+    Raises:
+        InvalidServiceDefinitionError: invalid service definition found.
+    """
+
+    module_name = module.__name__
+    service_module_name = module_name.rsplit('.', 1)[0]
+    logger.debug('Initializing module %s...', module_name)
+
+    try:
+        service_definition = getattr(
+            importlib.import_module(service_module_name), 'SERVICE_DEFINITION'
+        )
+    except AttributeError:
+        raise InvalidServiceDefinitionError(
+            f'No service definition found for {service_module_name}'
+        ) from None
+
+    try:
+        resource_definition = getattr(module, 'RESOURCE_DEFINITION')
+    except AttributeError:
+        raise InvalidServiceDefinitionError(
+            f'No resource definition found for {module_name}'
+        ) from None
+
+    try:
+        metadata_definition = resource_definition['responseSchema']
+    except KeyError:
+        raise InvalidServiceDefinitionError(
+            f'No "responseSchema" definition found for {module_name}'
+        ) from None
+
+    _, _, service, resource = module_name.split('.')
+    crawler_class = initialize_crawler(
+        service=service,
+        resource=resource,
+        class_definition=service_definition | resource_definition,
+    )
+    for metadata_class in initialize_crawler_metadata(
+        service=service, resource=resource, class_definition=metadata_definition
+    ):
+        setattr(crawler_class, metadata_class.__name__, metadata_class)  # type: ignore
+    _attach_metadata_properties(crawler_class, crawler_class._get_metadata_class())
+    setattr(module, crawler_class.__name__, crawler_class)  # type: ignore
+
+    return crawler_class
+
+
+def _attach_metadata_properties(crawler: GenericCrawler, metadata_class: Any) -> None:
+    """Attach metadata attribute properties to web crawler class.
+
+    Adds a read only property for each top level metadata attribute, so
+    resource data is read without falling back to `__getattr__`. Existing
+    crawler attributes take precedence.
+
+    Args:
+        crawler (GenericCrawler): Web crawler class.
+        metadata_class (GenericMetadata): Top level metadata class of crawler.
+    """
+
+    for name in metadata_class.__metadata_fields__:
+        if not hasattr(crawler, name):
+            setattr(crawler, name, property(attrgetter(f'__metadata__.{name}')))
+
+
 def initialize_crawler(
     service: str, resource: str, class_definition: dict[str, Any]
 ) -> GenericCrawler:
@@ -130,38 +227,30 @@ def initialize_crawler(
         InvalidServiceDefinitionError: invalid service definition found.
     """
 
-    required_definition_attributes = [
-        "globalService",
-        "resourceType",
-        "idAttribute",
-        "paginator",
-        "page_marker",
-        "scanParameters",
-        "responseSchema",
-    ]
-
     logger.trace('Collecting %s.%s crawler class attributes', service, resource)  # type: ignore
 
     # make sure required properties are present
-    for attribute in required_definition_attributes:
-        if attribute not in class_definition:
-            raise InvalidServiceDefinitionError(
-                f'Bad service definition found for {service}.{resource}. Missing "{attribute}" attribute.'
-            )
+    missing_attributes = _REQUIRED_DEFINITION_ATTRIBUTES - class_definition.keys()
+    if missing_attributes:
+        missing = ', '.join(f'"{attribute}"' for attribute in sorted(missing_attributes))
+        raise InvalidServiceDefinitionError(
+            f'Bad service definition found for {service}.{resource}. Missing {missing} attribute.'
+        )
 
+    # single shallow copy, response schema is only used for metadata classes
     class_definition = {
-        k: v for k, v in class_definition.items() if k != 'responseSchema'
+        'serviceType': service,
+        'resourceName': resource,
+        **class_definition,
     }
+    class_definition.pop('responseSchema', None)
     # build module path for later import
-    service_path = f'{MODULE_NAME}.service.{service}'
+    service_path = SERVICE_PREFIX + service
 
     return _resource_crawler_class_factory(
         service_path=service_path,
         class_name=f'{service}_{resource}',
-        class_definition={
-            **{'serviceType': service, 'resourceName': resource},
-            **class_definition,
-        },
+        class_definition=class_definition,
     )
 
 
@@ -193,7 +282,7 @@ def initialize_crawler_metadata(
         )
 
     metaclasses: tuple[GenericMetadata, ...] = tuple(
-        _create_crawler_metadata_classes(  # type: ignore[arg-type]
+        _create_crawler_metadata_classes(
             class_name=f'{service}_{resource}', class_definition=class_definition
         )
     )
@@ -221,99 +310,99 @@ def apply_external_evaluations(evaluations: list[str]) -> None:
         ) as err:
             logger.warning(err)
 
-    for service in [
-        f'{MODULE_NAME}.service.{service}.{resource}'
+    for service in (
+        f'{SERVICE_PREFIX}{service}.{resource}'
         for service, resources in external_evalutations.items()
         for resource in resources
-    ]:
+    ):
         for crawler in import_crawlers(path=service):
+            crawler_name = crawler.__name__
             try:
-                external_evaluation_includes: list[str] = list(
-                    external_evalutations[crawler.serviceType][
-                        crawler.resourceName
-                    ].pop('include')
-                )
                 external_evaluation_functions: dict[
                     str, FunctionType
                 ] = external_evalutations[crawler.serviceType][crawler.resourceName]
-                # build new includes list
-
-                logger.debug(
-                    'Applying external evaluation methods to %s.',
-                    type(crawler).__name__,
+                external_evaluation_includes: set[str] = (
+                    external_evaluation_functions.pop('include')  # type: ignore[assignment]
                 )
-                # set new crawler includes
-                crawler.INCLUDE.update(external_evaluation_includes)
-
-                for name, func in external_evaluation_functions.items():
-                    # ensure evalution is not override original attributes
-                    if getattr(GenericCrawler, name, False):
-                        raise EvaluationMethodNameError(
-                            f'Evaluation {name} invalid. {type(GenericCrawler)}.{name} cannot be overwritten.'
-                        )
-                    # add function name to evaluations func name list
-                    crawler.evaluations = tuple(
-                        [i for i in crawler.evaluations] + [name]
-                    )
-                    # add functions to crawler
-                    setattr(crawler, name, func)
-
             except KeyError:
                 logger.debug(
-                    'No external evaluation functions found for %s.',
-                    type(crawler).__name__,
+                    'No external evaluation functions found for %s.', crawler_name
                 )
                 continue
 
+            logger.debug('Applying external evaluation methods to %s.', crawler_name)
+            # set new crawler includes, INCLUDE may be inherited and must not be mutated
+            crawler.INCLUDE = crawler.INCLUDE | external_evaluation_includes
+
+            # ensure evalutions do not override original attributes
+            for name in external_evaluation_functions:
+                if name in _GENERIC_CRAWLER_ATTRIBUTES:
+                    raise EvaluationMethodNameError(
+                        f'Evaluation {name} invalid. {type(GenericCrawler)}.{name} cannot be overwritten.'
+                    )
+
+            # add function names to evaluations func name list
+            crawler.evaluations = crawler.evaluations + tuple(
+                external_evaluation_functions
+            )
+            # add functions to crawler
+            for name, func in external_evaluation_functions.items():
+                setattr(crawler, name, func)
+            # rebuild lookup table so rebound evaluations are not dispatched stale
+            crawler._build_evaluation_table()
+
 
-@no_type_check  # mypy doesn't handle complex recursion well.
 def _create_crawler_metadata_classes(
-    class_name: str,
-    class_definition: dict[str, Any] | list[Any] | Any,
-    collection: list[type] | None = None,
-    _depth: int = 0,
-) -> list[GenericMetadata] | tuple[Any, list[GenericMetadata]]:
+    class_name: str, class_definition: dict[str, Any]
+) -> list[GenericMetadata]:
     """Create metadata classes.
 
     Dynamically create metadata class, and associated subclasses for provided service and resource
-    parameters.
+    parameters. The definition is walked iteratively, nested classes are created before the
+    classes that reference them. Provided definition is not modified.
 
     Args:
         class_name (str): Name for new metadata class.
         class_definition (dict): data structure containing class attribute key/values.
-        data (dict): Resource of crawler class to create.
-        collection (list): Used for recursive creation of all metadata classes.
-        _depth (int): Used for recursion depth tracking.
 
     Return:
-        Tuple of new metadata classes
+        List of new metadata classes
     """
 
-    collection: list[GenericMetadata] = collection or []
+    collection: list[GenericMetadata] = []
+    root: dict[str, Any] = {}
 
-    # standard recursive dict structure to allow creation all layers of metadata class
-    if isinstance(class_definition, list):
-        for i in class_definition:
-            _, collection = _create_crawler_metadata_classes(
-                class_name, i, collection, _depth=_depth + 1
+    # each frame holds (children resolved, class name, metadata path, definition, parent scheme,
+    # key in parent). dict frames are revisited once all of their children have been resolved.
+    stack: list[tuple[bool, str, str, Any, dict[str, Any], str]] = [
+        (False, class_name, '', class_definition, root, '')
+    ]
+    while stack:
+        resolved, name, path, definition, parent, key = stack.pop()
+        if resolved:
+            metadata_class = _resource_crawler_metadata_class_factory(
+                class_name=name,
+                class_scheme=definition,
+                path=path,
             )
-        return (list, collection)
-    elif isinstance(class_definition, dict):
-        for k, v in class_definition.items():  # pylint: disable=invalid-name
-            attr, collection = _create_crawler_metadata_classes(
-                f'{class_name}_{k}', v, collection, _depth=_depth + 1
+            collection.append(metadata_class)  # type: ignore[arg-type]
+            parent[key] = metadata_class
+        elif isinstance(definition, dict):
+            scheme = dict.fromkeys(definition)
+            stack.append((True, name, path, scheme, parent, key))
+            stack.extend(
+                (False, f'{name}_{k}', path + k.capitalize(), v, scheme, k)
+                for k, v in reversed(definition.items())
             )
-            class_definition[k] = attr
-        metadata_class = _resource_crawler_metadata_class_factory(
-            class_name=class_name,
-            class_scheme=class_definition,
-        )
-        collection.append(metadata_class)
-        if not _depth:
-            return collection
-        return (metadata_class, collection)
-    else:
-        return (class_definition, collection)
+        elif isinstance(definition, list):
+            parent[key] = list
+            stack.extend(
+                (False, name, path, item, {}, '') for item in reversed(definition)
+            )
+        else:
+            parent[key] = definition
+
+    return collection
 
 
 def _resource_crawler_class_factory(
@@ -335,14 +424,14 @@ def _resource_crawler_class_factory(
     """
 
     # get custom paginator from service module if it exists
-    parent_module = importlib.import_module(service_path)
-    class_paginator: dict[str, type] = {
-        'custom_paginator': obj
-        for _, obj in getmembers(parent_module)
-        if isclass(obj)
-        and obj.__name__
-        == (f'{_serialize_class_name(class_definition["resourceName"])}Paginator')
-    }
+    paginator = getattr(
+        importlib.import_module(service_path),
+        f'{_serialize_class_name(class_definition["resourceName"])}Paginator',
+        None,
+    )
+    class_paginator: dict[str, type] = (
+        {'custom_paginator': paginator} if isclass(paginator) else {}
+    )
 
     if class_paginator:
         logger.trace('Custom paginator %s found.', class_paginator['custom_paginator'])  # type: ignore
@@ -353,52 +442,153 @@ def _resource_crawler_class_factory(
     return type(  # type: ignore
         class_name,
         (GenericCrawler,),
-        {**class_definition, **class_paginator},
+        {**class_definition, **class_paginator, '__slots__': ()},
     )
 
 
 def _resource_crawler_metadata_class_factory(
-    class_name: str, class_scheme: dict[str, Any]
+    class_name: str, class_scheme: dict[str, Any], path: str = ''
 ) -> type:
     """Class factory for metadata class.
 
-    Creates a new dataclass with name and definition provided. Ensures all attributes
-    are immutable.
+    Creates a new class with name provided, derived from a metadata base class
+    built for the definition provided. Ensures all attributes are immutable. Base
+    classes are only built once for each distinct definition.
 
     Args:
         class_name (str): Name for new metadata class.
         class_scheme (dict): data structure containing class attribute key/values
+        path (str): (Optional) metadata path of new class. Defaults to empty string.
 
     Return:
         New class.
     """
 
     class_name = _serialize_class_name(f'{class_name}_metadata')
-    class_fields: list[tuple[str, type, Any]] = []
+    signature = tuple(class_scheme.items())
+
+    base_class = _METADATA_BASE_CACHE.get(signature)
+    if base_class is None:
+        base_class = _metadata_base_class_factory(f'{class_name}Base', signature)
+        _METADATA_BASE_CACHE[signature] = base_class
+
+    logger.trace('Generating metadata class "%s".', class_name)  # type: ignore
+    # child metadata paths are resolved once here, rather than for every resource
+    return type(
+        class_name,
+        (base_class,),
+        {
+            '__slots__': (),
+            '__metadata_child_paths__': {
+                f_name: path + f_name.capitalize()
+                for f_name in base_class.__metadata_fields__  # type: ignore[attr-defined]
+            },
+        },
+    )
+
 
-    # Transform class definition to dataclass definition
-    for f_name, f_type in class_scheme.items():
+def _metadata_base_class_factory(
+    class_name: str, signature: tuple[tuple[str, Any], ...]
+) -> type:
+    """Class factory for metadata base class.
+
+    Creates a new slotted `GenericMetadata` subclass with name and attributes
+    provided. The `__init__` and `asdict` methods are generated from source,
+    handling each attribute once.
+
+    Args:
+        class_name (str): Name for new class.
+        signature (tuple): attribute name/type pairs.
+
+    Return:
+        New class.
+
+    Raises:
+        InvalidServiceDefinitionError: attribute name is not a valid identifier.
+    """
+
+    field_names: list[str] = []
+    parameters: list[str] = []
+    body: list[str] = []
+    asdict_items: list[str] = []
+    namespace: dict[str, Any] = {
+        '__missing__': _MISSING,
+        '__setattr__': object.__setattr__,
+        '__asdict__': _metadata_asdict,
+    }
+
+    # Transform class definition to __init__ parameters and assignments
+    for f_name, f_type in signature:
+        if not f_name.isidentifier() or iskeyword(f_name):
+            raise InvalidServiceDefinitionError(
+                f'Bad metadata definition found for {class_name}. Invalid attribute "{f_name}".'
+            )
         if f_type is list:
-            class_fields.append((f_name, f_type, field(default_factory=tuple)))
+            default = '()'
+            # lists may hold nested metadata
+            asdict_items.append(f'{f_name!r}: __asdict__(__self__.{f_name})')
         elif f_type in (int, float):
-            class_fields.append((f_name, f_type, field(default=0)))
+            default = '0'
         elif f_type is str:
-            class_fields.append((f_name, f_type, field(default='')))
+            default = "''"
         elif f_type is bool:
-            class_fields.append((f_name, f_type, field(default=False)))
-        elif is_dataclass(f_type):
-            class_fields.append((f_name, type(f_type), field(default_factory=f_type)))
-
-    logger.trace('Generating metadata class "%s".', class_name)  # type: ignore
-    return make_dataclass(
-        cls_name=class_name, fields=class_fields, frozen=True, slots=True
+            default = 'False'
+        elif isclass(f_type) and issubclass(f_type, GenericMetadata):
+            # nested metadata defaults to a new instance with default values
+            namespace[f'__factory_{f_name}__'] = f_type
+            parameters.append(f'{f_name}=__missing__')
+            body.append(
+                f'    __setattr__(__self__, {f_name!r}, __factory_{f_name}__()'
+                f' if {f_name} is __missing__ else {f_name})'
+            )
+            asdict_items.append(f'{f_name!r}: __asdict__(__self__.{f_name})')
+            field_names.append(f_name)
+            continue
+        else:
+            continue
+        if f_type is not list:
+            # scalar values are returned as is
+            asdict_items.append(f'{f_name!r}: __self__.{f_name}')
+        parameters.append(f'{f_name}={default}')
+        body.append(f'    __setattr__(__self__, {f_name!r}, {f_name})')
+        field_names.append(f_name)
+
+    source = (
+        f'def __init__(__self__, {", ".join(parameters)}):\n'
+        + ('\n'.join(body) or '    pass')
+        + '\n\n'
+        + 'def asdict(__self__):\n    return {'
+        + ', '.join(asdict_items)
+        + '}\n'
+    )
+    # field names are validated with isidentifier() and iskeyword() above
+    exec(source, namespace)  # nosec B102
+    init = namespace['__init__']
+    init.__qualname__ = f'{class_name}.__init__'
+    asdict = namespace['asdict']
+    asdict.__qualname__ = f'{class_name}.asdict'
+    asdict.__doc__ = GenericMetadata.asdict.__doc__
+
+    logger.trace('Generating metadata base class "%s".', class_name)  # type: ignore
+    return type(
+        class_name,
+        (GenericMetadata,),
+        {
+            '__slots__': tuple(field_names),
+            '__metadata_fields__': tuple(field_names),
+            '__metadata_field_set__': frozenset(field_names),
+            '__match_args__': tuple(field_names),
+            '__init__': init,
+            'asdict': asdict,
+        },
     )
 
 
+@lru_cache(maxsize=None)
 def _serialize_class_name(name: str) -> str:
     """Serialize class name.
 
-    Removes all dashes and capatilizes all words.
+    Removes all dashes and capatilizes all words. Results are memoized.
 
     Args:
         name (str): Name to serialize.
@@ -407,13 +597,15 @@ def _serialize_class_name(name: str) -> str:
         Serialized name.
     """
 
-    return ''.join([word.capitalize() for word in name.split('_')])
+    # str.title() is not equivalent, it also capitalizes letters following digits
+    return ''.join(map(str.capitalize, name.split('_')))
 
 
 def _import_external_evaluations(path: str) -> dict[str, Any]:
     """Load external evaluations.
 
-    Load provided external evalulation modules, and all submodules.
+    Load provided external evalulation modules, and all submodules. Results
+    are cached per path, callers receive a copy they are free to modify.
 
     Args:
         path (str): Path to external module
@@ -425,18 +617,75 @@ def _import_external_evaluations(path: str) -> dict[str, Any]:
         EvaluationModuleNotFoundError: Failed to retrieve evaluation data.
     """
 
+    cache_key = os.path.abspath(path) if os.path.exists(path) else path
+    if cache_key in _EXTERNAL_EVALUATIONS_CACHE:
+        logger.debug('Loading evaluations for %s from cache', path)
+        return deepcopy(_EXTERNAL_EVALUATIONS_CACHE[cache_key])
+
+    module = _import_evaluation_module(path)
+
+    # search module for submodules, or load functions from this module
+    if getattr(module, '__path__', None):
+        modules = [
+            _import_evaluation_module(sub_module_name)
+            for sub_module_name in _walk_submodules(module)
+        ]
+    else:
+        modules = [module]
+
     evaluations: dict[str, Any] = {}
+    for leaf_module in modules:
+        evaluations = _merge_dictionaries(
+            evaluations, _extract_external_evaluation_functions(leaf_module)
+        )
+
+    _EXTERNAL_EVALUATIONS_CACHE[cache_key] = evaluations
+    return deepcopy(evaluations)
+
+
+def _import_evaluation_module(path: str) -> ModuleType:
+    """Import external evaluation module.
+
+    Imports external evaluation module by path, if file, or as module. A
+    directory is imported as package, with its parent directory added to
+    `sys.path`.
+
+    Args:
+        path (str): Path to external module, or module name.
+
+    Return:
+        Imported module.
+
+    Raises:
+        EvaluationModuleNotFoundError: Failed to import module.
+        EvaluationModuleFailedToLoadError: Module does not exist, or directory
+            name resolves to a different module.
+    """
 
-    # try and import, either by path (if file), or as module (if directory)
     try:
         logger.debug('loading module from %s...', path)
         if os.path.isfile(path):
             spec = spec_from_file_location("external_evaluations", path)
-            module = module_from_spec(spec)
-            spec.loader.exec_module(module)
-        else:
-            sys.path.append(path)
-            module = importlib.import_module(path)
+            module = module_from_spec(spec)  # type: ignore[arg-type]
+            spec.loader.exec_module(module)  # type: ignore[union-attr]
+            return module
+        if not os.path.isdir(path):
+            return importlib.import_module(path)
+
+        directory = os.path.abspath(path)
+        parent, name = os.path.split(directory)
+        if parent not in sys.path:
+            sys.path.append(parent)
+        module = importlib.import_module(name)
+        # directories with the same name (e.g. teamA/evaluations and teamB/evaluations)
+        # import as the same module, which must be the one at this path
+        locations = [os.path.abspath(p) for p in getattr(module, '__path__', ())]
+        if locations != [directory]:
+            raise EvaluationModuleFailedToLoadError(
+                f'Failed to load {path} -- module {name} is already loaded from '
+                f'{", ".join(locations) or module.__file__}'
+            )
+        return module
     except ModuleNotFoundError as err:
         raise EvaluationModuleFailedToLoadError(
             f'Failed to load {path} -- {err}'
@@ -444,24 +693,6 @@ def _import_external_evaluations(path: str) -> dict[str, Any]:
     except ImportError as err:
         raise EvaluationModuleNotFoundError(f'Could not load module {path}') from err
 
-    # search module for submodules
-    if getattr(module, '__path__', None):
-        for _, sub_module_name, is_pkg in pkgutil.walk_packages(
-            module.__path__, module.__name__ + '.'
-        ):
-            if not is_pkg:
-                # recurively load submodules
-                evaluations = _merge_dictionaries(
-                    evaluations, _import_external_evaluations(sub_module_name)
-                )
-    # no submodules, load functions from this module
-    else:
-        evaluations = _merge_dictionaries(
-            evaluations, _extract_external_evaluation_functions(module)
-        )
-
-    return evaluations
-
 
 def _extract_external_evaluation_functions(module: ModuleType) -> dict[str, Any]:
     """Extract evaluation data from module.
@@ -478,23 +709,23 @@ def _extract_external_evaluation_functions(module: ModuleType) -> dict[str, Any]
     module_data: dict[str, Any] = {}
 
     # for each evaluation function in module
-    for name, func in {
-        obj.__name__: obj
-        for _, obj in getmembers(module)
-        if isfunction(obj) and getattr(obj, '__evaluation__', False)
-    }.items():
+    for obj in vars(module).values():
+        # evaluation attributes are set by the decorator in the function __dict__
+        if not isfunction(obj):
+            continue
+        attributes = obj.__dict__
+        if not attributes.get('__evaluation__'):
+            continue
+        name = obj.__name__
         logger.trace('External evaluation method %s found.', name)  # type: ignore
         # make sure module_data is populated appropriately
-        if func.__service__ not in module_data:  # type: ignore
-            module_data[func.__service__] = {func.__resource__: {'include': set()}}  # type: ignore
-        if func.__resource__ not in module_data[func.__service__]:  # type: ignore
-            module_data[func.__service__][func.__resource__] = {'include': set()}  # type: ignore
+        resource_data = module_data.setdefault(
+            attributes['__service__'], {}
+        ).setdefault(attributes['__resource__'], {'include': set()})
 
         # update module_data with function data
-        module_data[func.__service__][func.__resource__]['include'].update(  # type: ignore
-            func.__includes__  # type: ignore
-        )
-        module_data[func.__service__][func.__resource__].update({name: func})  # type: ignore
+        resource_data['include'].update(attributes['__includes__'])
+        resource_data[name] = obj
 
     return module_data
 
@@ -502,7 +733,8 @@ def _extract_external_evaluation_functions(module: ModuleType) -> dict[str, Any]
 def _get_crawler_class(module: ModuleType) -> GenericCrawler:
     """Get web crawler class from module.
 
-    Scans provided module and returns the `GenericCrawler` if found.
+    Looks up the `GenericCrawler` under its expected class name, falling
+    back to scanning provided module.
 
     Args:
         module (ModuleType): Module to scan.
@@ -513,11 +745,20 @@ def _get_crawler_class(module: ModuleType) -> GenericCrawler:
     Raises:
         CrawlerNotFoundError: if class is not found.
     """
+
+    # crawler classes are attached to resource modules as `ServiceResource`
+    members = vars(module)
+    crawler = members.get(
+        _serialize_class_name('_'.join(module.__name__.rsplit('.', 2)[-2:]))
+    )
+    if isclass(crawler) and issubclass(crawler, GenericCrawler):
+        return crawler  # type: ignore
+
     try:
         return next(
             (
                 obj  # type: ignore
-                for _, obj in getmembers(module)
+                for obj in members.values()
                 if isclass(obj) and issubclass(obj, GenericCrawler)
             )
         )
@@ -527,10 +768,71 @@ def _get_crawler_class(module: ModuleType) -> GenericCrawler:
         ) from None
 
 
+def _walk_submodules(module: ModuleType) -> tuple[str, ...]:
+    """Get submodule names of package.
+
+    Walks provided package and returns the names of all non-package
+    submodules. Results are cached per package name.
+
+    Args:
+        module (ModuleType): Package to walk.
+
+    Return:
+        Tuple of submodule names.
+    """
+
+    name = module.__name__
+    if name not in _SUBMODULES_CACHE:
+        _SUBMODULES_CACHE[name] = tuple(
+            sub_module_name
+            for path in module.__path__
+            for sub_module_name in _scan_package_dir(path, name + '.')
+        )
+    return _SUBMODULES_CACHE[name]
+
+
+def _scan_package_dir(path: str, prefix: str) -> Generator[str, None, None]:
+    """Scan package directory for submodules.
+
+    Recursively scans package directory for python modules. Directories
+    are only followed if they contain an `__init__.py`, matching
+    `pkgutil.walk_packages`. Uses `os.scandir` to avoid extra stat calls.
+
+    Args:
+        path (str): Package directory to scan.
+        prefix (str): Prefix for submodule names.
+
+    Return:
+        Generator of submodule names.
+    """
+
+    try:
+        with os.scandir(path) as scanner:
+            entries = sorted(scanner, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        entry_name = entry.name
+        # hidden entries and `__pycache__` are never part of a package
+        if entry_name.startswith('.') or entry_name == '__pycache__':
+            continue
+        if entry.is_dir():
+            if '.' not in entry_name and os.path.isfile(
+                os.path.join(entry.path, '__init__.py')
+            ):
+                yield from _scan_package_dir(entry.path, f'{prefix}{entry_name}.')
+        elif entry_name.endswith('.py') and entry_name != '__init__.py':
+            module_name = entry_name[:-3]
+            if '.' not in module_name:
+                yield prefix + module_name
+
+
 def _merge_dictionaries(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[str, Any]:
     """Merge two dictionaries.
 
-    Recursively merge two dictionaries.
+    Iteratively merge `dict1` into `dict2`. Sets are combined, otherwise
+    existing values in `dict2` take precedence.
 
     Args:
         dict1 (dict): first dictionary
@@ -540,13 +842,17 @@ def _merge_dictionaries(dict1: dict[str, Any], dict2: dict[str, Any]) -> dict[st
         Merged dictionary.
     """
 
-    for key, val in dict1.items():
-        if isinstance(val, dict):
-            dict2_node = dict2.setdefault(key, {})
-            v: dict[str, Any] = val  # pylint: disable=invalid-name
-            _merge_dictionaries(v, dict2_node)
-        else:
-            if key not in dict2:
-                dict2[key] = val
+    stack: list[tuple[dict[str, Any], dict[str, Any]]] = [(dict1, dict2)]
+
+    while stack:
+        src, dst = stack.pop()
+        setdefault = dst.setdefault
+        for key, val in src.items():
+            if isinstance(val, dict):
+                stack.append((val, setdefault(key, {})))
+            elif isinstance(val, set):
+                setdefault(key, set()).update(val)
+            else:
+                setdefault(key, val)
 
     return dict2
@@ -16,13 +16,27 @@ limitations under the License.
 """Type stub file"""
 
 from types import ModuleType
-from typing import Any
+from typing import Any, Collection, Generator
 
-from aerographer.crawler.generic import GenericCrawler, GenericMetadata
+from aerographer.crawler.generic import (
+    GenericCrawler,
+    GenericMetadata,
+    _metadata_asdict,
+)
 
 _CRAWLER_CACHE: dict[str, GenericCrawler]
+_SUBMODULES_CACHE: dict[str, tuple[str, ...]]
+_METADATA_BASE_CACHE: dict[tuple[tuple[str, Any], ...], type]
+_EXTERNAL_EVALUATIONS_CACHE: dict[str, dict[str, Any]]
+_GENERIC_CRAWLER_ATTRIBUTES: frozenset[str]
+_MISSING: object
+_REQUIRED_DEFINITION_ATTRIBUTES: frozenset[str]
 
-def import_crawlers(service: str, skip: list[str], quiet_skip: bool) -> list[GenericCrawler]: ...
+def import_crawlers(
+    path: str, skip: Collection[str] | None = ..., quiet_skip: bool = ...
+) -> list[GenericCrawler]: ...
+def initialize_resource(module: ModuleType) -> GenericCrawler: ...
+def _attach_metadata_properties(crawler: GenericCrawler, metadata_class: Any) -> None: ...
 def initialize_crawler(
     service: str,
     resource: str,
@@ -34,23 +48,26 @@ def initialize_crawler_metadata(
 ) -> tuple[GenericMetadata, ...] | None: ...
 def apply_external_evaluations(evaluations: list[str]) -> None: ...
 def _create_crawler_metadata_classes(
-    class_name: str,
-    data: dict[str, Any] | list[Any] | Any,
-    collection: list[GenericMetadata] | None = ...,
-    _depth: int = ...,
-) -> list[GenericMetadata] | tuple[Any, list[GenericMetadata]]: ...
+    class_name: str, class_definition: dict[str, Any]
+) -> list[GenericMetadata]: ...
 def _resource_crawler_class_factory(
     service_path: str, class_name: str, class_definition: dict[str, Any]
 ) -> GenericCrawler: ...
 def _resource_crawler_metadata_class_factory(
-    class_name: str, class_definition: list[list[Any]]
+    class_name: str, class_scheme: dict[str, Any], path: str = ...
 ) -> GenericMetadata: ...
+def _metadata_base_class_factory(
+    class_name: str, signature: tuple[tuple[str, Any], ...]
+) -> type: ...
 def _serialize_class_name(name: str) -> str: ...
 def _import_external_evaluations(path: str) -> dict[str, Any]: ...
+def _import_evaluation_module(path: str) -> ModuleType: ...
 def _extract_external_evaluation_functions(
     module: ModuleType, data: dict[str, Any]
 ) -> dict[str, Any]: ...
 def _get_crawler_class(module: ModuleType) -> GenericCrawler: ...
+def _walk_submodules(module: ModuleType) -> tuple[str, ...]: ...
+def _scan_package_dir(path: str, prefix: str) -> Generator[str, None, None]: ...
 def _merge_dictionaries(
     dict1: dict[str, Any], dict2: dict[str, Any]
 ) -> dict[str, Any]: ...
\ No newline at end of file
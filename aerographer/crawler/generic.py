@@ -19,19 +19,27 @@ Contains the generic base class `GenericCrawler` and `GenericCustomPaginator`
 that all dynamically generated web crawlers. Not meant for external use.
 """
 
+from operator import itemgetter
 from types import FunctionType
-from typing import Any, Callable, Generator, Iterable, Protocol
-from dataclasses import asdict
+from typing import Any, AsyncIterator, Callable, Generator
+from threading import Lock, RLock
+import sys
 import json
 import asyncio
 
 from botocore.exceptions import ParamValidationError, ClientError, OperationNotPageableError  # type: ignore
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 import aerographer.scan as scan
 from aerographer.scan.context import CONTEXT
-from aerographer.scan.parallel import asyncify, async_paginate
+from aerographer.scan.parallel import async_stream
 from aerographer.evaluations import Result
 from aerographer.logger import logger
+from aerographer.config import CONTEXT_CONCURRENCY
 from aerographer.exceptions import (
     ActiveCrawlerScanError,
     FailedCrawlerScanError,
@@ -43,6 +51,9 @@ from aerographer.exceptions import (
     FrozenInstanceError,
 )
 
+# guards creation of per instance evaluation locks
+_EVALUATION_LOCKS_GUARD = Lock()
+
 
 class PaginateWrapper:
     """Wrapper class for boto3 client function without native paginator.
@@ -53,6 +64,7 @@ class PaginateWrapper:
 
     Methods:
         paginate(**kwargs): Retrieve data.
+        apaginate(**kwargs): Retrieve data asyncronously.
     """
 
     def __init__(self, func: FunctionType, page_marker: str) -> None:
@@ -71,39 +83,102 @@ class PaginateWrapper:
         page: dict[str, Any] = self.func(**kwargs)
         yield page
 
-        if self.page_marker:
-            if self.page_marker in page:
-                while self.page_marker in page:
-                    page = self.func(
-                        **{self.page_marker: page[self.page_marker]} | kwargs
-                    )
-                    yield page
+        resolved = self._resolve_marker(page)
+        if resolved is None:
+            return
+        marker, has_next = resolved
+
+        # kwargs are copied once, only the marker is replaced for each page
+        call_kwargs = dict(kwargs)
+        while has_next(page):
+            call_kwargs[marker] = page[marker]
+            page = self.func(**call_kwargs)
+            yield page
+
+    async def apaginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+        """Iterate through pages of resource asyncronously.
+
+        Iterages through all pages of information provided by API call
+        made by provided function. Each call runs in an asyncio thread, the
+        next page is requested before the current page is returned. If iteration
+        stops early, that prefetched request still completes in its thread, so
+        one extra page may be requested.
+
+        Returns:
+            Async iterator of pages.
+        """
+        page: dict[str, Any] = await asyncio.to_thread(self.func, **kwargs)
 
-            elif 'IsTruncated' in page:
-                while page['IsTruncated']:
-                    page = self.func(
-                        **{self.page_marker: page[self.page_marker]} | kwargs
+        resolved = self._resolve_marker(page)
+        if resolved is None:
+            yield page
+            return
+        marker, has_next = resolved
+
+        call_kwargs = dict(kwargs)
+        next_page: asyncio.Future[dict[str, Any]] | None = None
+        try:
+            while True:
+                # prefetch next page while current page is processed
+                if has_next(page):
+                    call_kwargs[marker] = page[marker]
+                    next_page = asyncio.ensure_future(
+                        asyncio.to_thread(self.func, **call_kwargs)
                     )
-                    yield page
+                else:
+                    next_page = None
+
+                yield page
+
+                if next_page is None:
+                    return
+                page = await next_page
+        finally:
+            if next_page is not None:
+                if not next_page.done():
+                    # only discards the result, the thread keeps running
+                    next_page.cancel()
+                elif not next_page.cancelled():
+                    # retrieve a failed prefetch so it is not logged as never retrieved
+                    next_page.exception()
+
+    def _resolve_marker(
+        self, page: dict[str, Any]
+    ) -> tuple[str, Callable[[dict[str, Any]], bool]] | None:
+        """Resolve page marker.
+
+        Resolves page marker and stop condition from the first page. Pages are
+        followed while the marker is present, or while `IsTruncated` is set.
+
+        Args:
+            page (dict): First page.
+
+        Returns:
+            Page marker and predicate returning if a page has a next page, or None
+            if there is a single page.
+        """
+        if self.page_marker:
+            marker = self.page_marker
+            by_marker = marker in page
         # TODO: Legacy method of using page marker. SERVICE_DEFINITIONS need to be updated with appropriate page_marker attributes.
         else:
-            if 'NextToken' in page:
-                while 'NextToken' in page:
-                    page = self.func(NextToken=page['NextToken'], **kwargs)
-                    yield page
+            marker = 'NextToken' if 'NextToken' in page else 'Marker'
+            by_marker = marker == 'NextToken'
 
-            elif 'IsTruncated' in page:
-                while page['IsTruncated']:
-                    page = self.func(Marker=page['Marker'], **kwargs)
-                    yield page
+        if by_marker:
+            return marker, lambda next_page: marker in next_page
+        if 'IsTruncated' in page:
+            return marker, itemgetter('IsTruncated')
+        return None
 
 
 class GenericCustomPaginator:
     """Abstract class for custom paginators.
 
     Custom paginators need to be used when boto3 does not provided a builtin
-    paginator for a specific resource. Custom paginators must return a list of
-    pages following the same format that boto3 default paginators provide.
+    paginator for a specific resource. Custom paginators must implement `paginate`
+    as an async generator yielding pages, following the same format that boto3
+    default paginators provide.
     The `INCLUDE` class attribute can be used to ensure required dependant data
     is available prior to retrieving resource page data.
 
@@ -145,24 +220,121 @@ class GenericCustomPaginator:
         setattr(self.paginator, 'context', context.name)
         setattr(self.paginator, 'function', paginator_func_name)
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Default method definition.
 
         Inheriting class must implement method that retrieves list of pages for resource data.
+        Pages are streamed as they are retrieved.
 
         Returns:
-            List of pages.
+            Async iterator of pages.
         """
-        pages = await async_paginate(paginator=self.paginator, **kwargs)
-        return tuple(pages[0])
+        if isinstance(self.paginator, PaginateWrapper):
+            pages = self.paginator.apaginate(**kwargs)
+        else:
+            pages = async_stream(self.paginator, **kwargs)
+
+        async for page in pages:
+            yield page
+
+
+class GenericMetadata:
+    """Base class for metadata classes.
+
+    Metadata classes are generated dynamically from resource response schemas
+    during crawler initialization. Instances are immutable, attribute values are
+    stored in slots named in `__metadata_fields__`.
+
+    Attributes:
+        __metadata_fields__ (tuple[str, ...]): (class attribute) Names of metadata attributes.
+        __metadata_field_set__ (frozenset[str]): (class attribute) `__metadata_fields__` for membership tests.
+        __metadata_child_paths__ (dict[str, str]): (class attribute) Metadata class path of each attribute.
+
+    Methods:
+        asdict(): Return metadata as dictionary.
+    """
+
+    __slots__ = ()
+    __metadata_fields__: tuple[str, ...] = ()
+    __metadata_field_set__: frozenset[str] = frozenset()
+    __metadata_child_paths__: dict[str, str] = {}
+
+    def asdict(self) -> dict[str, Any]:
+        """Return metadata as dictionary.
+
+        Recursively converts metadata, including nested metadata, to
+        dictionaries.
+
+        Returns:
+            Dictionary of attributes.
+        """
+
+        return {
+            name: _metadata_asdict(getattr(self, name))
+            for name in self.__metadata_fields__
+        }
+
+    def __eq__(self, __o: object) -> bool:
+        if __o.__class__ is self.__class__:
+            return _metadata_values(self) == _metadata_values(__o)  # type: ignore[arg-type]
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(_metadata_values(self))
+
+    def __repr__(self) -> str:
+        attributes = ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in self.__metadata_fields__
+        )
+        return f'{self.__class__.__qualname__}({attributes})'
+
+    def __delattr__(self, __key: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{__key}'")
+
+    def __setattr__(self, __key: str, __val: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{__key}'")
+
+    def __getstate__(self) -> tuple[Any, ...]:
+        return _metadata_values(self)
+
+    def __setstate__(self, state: tuple[Any, ...]) -> None:
+        for name, value in zip(self.__metadata_fields__, state):
+            object.__setattr__(self, name, value)
+
+
+def _metadata_values(metadata: GenericMetadata) -> tuple[Any, ...]:
+    """Get metadata attribute values.
+
+    Args:
+        metadata (GenericMetadata): Metadata instance.
+
+    Return:
+        Tuple of attribute values, in field order.
+    """
+
+    return tuple(getattr(metadata, name) for name in metadata.__metadata_fields__)
+
 
+def _metadata_asdict(value: Any) -> Any:
+    """Convert metadata value.
 
-class GenericMetadata(Protocol):
-    """Protocol for dataclass, used for type checking for Metadata class."""
+    Recursively converts metadata instances to dictionaries, leaving all
+    other values untouched.
 
-    # checking for this attribute is currently the most reliable way
-    # to ascertain that something is a dataclass
-    __dataclass_fields__: dict[str, Any]
+    Args:
+        value (Any): Value to convert.
+
+    Return:
+        Converted value.
+    """
+
+    if isinstance(value, GenericMetadata):
+        return value.asdict()
+    if isinstance(value, (list, tuple)):
+        return type(value)(_metadata_asdict(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _metadata_asdict(v) for k, v in value.items()}
+    return value
 
 
 class GenericCrawler:
@@ -174,7 +346,7 @@ class GenericCrawler:
     If a custom paginator is required, it must be located in the target aerographer.service __init__.py
     file. Custom paginators and evaluation functions (both local and externally provided) are detected and
     attached to the web crawler class during class generation. Data assigned to class instances are dynamically
-    build dataclasses that are immutable and designed for efficient data retrieval.
+    build metadata classes that are immutable and designed for efficient data retrieval.
 
 
     Attributes:
@@ -195,8 +367,18 @@ class GenericCrawler:
         scan(): (class method) Scan resource and return a new class instance for each resource found.
     """
 
+    # instance attributes, definition values are class attributes
+    __slots__ = (
+        '__metadata__',
+        'context',
+        'results',
+        '_results_index',
+        '_evaluation_locks',
+        'id',
+        '_frozen',
+    )
+
     state: str = 'initialized'
-    _frozen: bool = False
     evaluations: tuple[str, ...] = ()
     custom_paginator: GenericCustomPaginator | None = None
     INCLUDE: set[str] = set()
@@ -211,10 +393,46 @@ class GenericCrawler:
     scanParameters: dict[str, Any]
     idAttribute: str
 
+    # 'service.resource' key, set on each generated crawler class
+    _include_key: str
+    # metadata classes by path, populated on first lookup
+    _metadata_classes: dict[str, type]
+    # evaluation functions and whether they take a survey, rebuilt when evaluations change
+    _evaluation_table: dict[str, tuple[Callable[..., Any], bool]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._include_key = f'{cls.serviceType}.{cls.resourceName}'
+        cls._metadata_classes = {}
+        cls._build_evaluation_table()
+
+    @classmethod
+    def _build_evaluation_table(cls) -> None:
+        """Build evaluation lookup table.
+
+        Resolves each name in `evaluations` to its function and whether it
+        takes a survey. Must be called again whenever evaluations are changed.
+        The table is replaced rather than mutated, so concurrent evaluations
+        only ever read a complete table.
+        """
+
+        table: dict[str, tuple[Callable[..., Any], bool]] = {}
+        for evaluation in cls.evaluations:
+            eval_func = getattr(cls, evaluation, None)
+            if callable(eval_func):
+                table[evaluation] = (
+                    eval_func,
+                    len(getattr(eval_func, '__includes__', ())) > 0,
+                )
+        cls._evaluation_table = table
+
     def __init__(self, context: CONTEXT, metadata: dict[str, Any]) -> None:
+        self._frozen = False
         self.__metadata__ = self._build_metadata(metadata=metadata)
         self.context = context
         self.results: list[tuple[str, Result]] = []
+        self._results_index: dict[str, Result] = {}
+        self._evaluation_locks: dict[str, RLock] = {}
 
         self._set_id()
         self._frozen = True
@@ -226,7 +444,7 @@ class GenericCrawler:
         definition idAttribute value, and assigned as class id attribute.
         """
 
-        self.id: str = getattr(
+        self.id = getattr(
             self.__metadata__, self.idAttribute, ''
         )  # pylint: disable=invalid-name
 
@@ -249,22 +467,49 @@ class GenericCrawler:
         """
 
         # return status if evaluation already run
-        for result in self.results:
-            if result[0] == evaluation:
-                return result[1].status
+        if evaluation in self._results_index:
+            return self._results_index[evaluation].status
+
+        # evaluations may run on several threads. a lock per evaluation keeps each
+        # from running twice, without serializing unrelated evaluations.
+        lock = self._evaluation_locks.get(evaluation)
+        if lock is None:
+            with _EVALUATION_LOCKS_GUARD:
+                lock = self._evaluation_locks.setdefault(evaluation, RLock())
+
+        with lock:
+            if evaluation in self._results_index:
+                return self._results_index[evaluation].status
+            return self._evaluate(evaluation, survey)
+
+    def _evaluate(self, evaluation: str, survey) -> bool:
+        """Run and record a single evaluation.
+
+        Called by `evaluate` while holding the evaluation lock.
+
+        Args:
+            evaluation (str): name of evaluation to run.
+
+        Returns:
+            bool: status of evaluation
+        """
 
         # try to get requested evaluation function
         try:
-            eval_func: Callable[..., Any] = getattr(self, evaluation)
-        except AttributeError as err:
-            raise EvaluationMethodNotFoundError(
-                f'{evaluation} is not a valid evaluation name for {self.__class__.__name__}'
-            ) from err
+            eval_func, takes_survey = self._evaluation_table[evaluation]
+        except KeyError:
+            # names outside `evaluations` are resolved on each call
+            eval_func = getattr(self.__class__, evaluation, None)  # type: ignore[assignment]
+            if not callable(eval_func):
+                raise EvaluationMethodNotFoundError(
+                    f'{evaluation} is not a valid evaluation name for {self.__class__.__name__}'
+                ) from None
+            takes_survey = len(getattr(eval_func, '__includes__', ())) > 0
 
         # run evlaution and record result
-        if len(eval_func.__includes__) > 0:  # type: ignore[attr-defined]
+        if takes_survey:
             try:
-                eval_result = eval_func(survey=survey)
+                eval_result = eval_func(self, survey=survey)
             except TypeError as err:
                 if "got an unexpected keyword argument 'survey'" in str(err):
                     raise EvaluationMethodInputError(
@@ -273,7 +518,7 @@ class GenericCrawler:
                 raise err
 
         else:
-            eval_result = eval_func()
+            eval_result = eval_func(self)
 
         if not isinstance(eval_result, Result):
             raise EvaluationMethodResultOutputError(
@@ -281,6 +526,7 @@ class GenericCrawler:
             )
 
         self.results.append((eval_func.__name__, eval_result))
+        self._results_index[eval_func.__name__] = eval_result
 
         # return evalutions status
         return eval_result.status
@@ -305,7 +551,8 @@ class GenericCrawler:
     ) -> GenericMetadata | tuple[Any] | Any:
         """Populates metadata class.
 
-        Creates a new metadata class populated with provided metadata.
+        Creates a new metadata class populated with provided metadata. String
+        values are interned.
 
         Args:
             metadata (dict): metadata to populate metadata class instance with.
@@ -320,20 +567,26 @@ class GenericCrawler:
         if isinstance(metadata, list):
             return tuple(self._build_metadata(i, path) for i in metadata)
         elif isinstance(metadata, dict):
-            for k, v in metadata.items():  # pylint: disable=invalid-name
-                metadata[k] = self._build_metadata(v, path + k.capitalize())
             metadata_class = self._get_metadata_class(path)
-            # Find any discrepencies between metadata cls and scan data. Report and remove missing attributes.
-            for missing_attr in [
-                attr
-                for attr in metadata.keys()
-                if attr not in metadata_class.__dataclass_fields__
-            ]:
-                logger.warn(
-                    f'{metadata_class.__name__} received unexpected attribute: {missing_attr}'  # type: ignore
+            allowed = metadata_class.__metadata_field_set__
+            child_paths = metadata_class.__metadata_child_paths__
+            # Find any discrepencies between metadata cls and scan data. Report and skip missing attributes.
+            for missing_attr in metadata.keys() - allowed:
+                logger.warning(
+                    '%s received unexpected attribute: %s',
+                    metadata_class.__name__,  # type: ignore[attr-defined]
+                    missing_attr,
                 )
-                del metadata[missing_attr]
-            return metadata_class(**metadata)  # type: ignore[operator]
+            return metadata_class(  # type: ignore[operator]
+                **{
+                    k: self._build_metadata(v, child_paths[k])
+                    for k, v in metadata.items()  # pylint: disable=invalid-name
+                    if k in allowed
+                }
+            )
+        elif type(metadata) is str:  # pylint: disable=unidiomatic-typecheck
+            # repeated values (states, regions, tag keys) share a single string object
+            return sys.intern(metadata)
         else:
             return metadata
 
@@ -341,7 +594,8 @@ class GenericCrawler:
     def _get_metadata_class(cls, name: str = '') -> GenericMetadata:
         """Get requested metadata class.
 
-        Retrieves metadata class with name provided.
+        Retrieves metadata class with name provided. Lookups are cached
+        per crawler class.
 
         Args:
             name (str): Name of metadata class to get.
@@ -353,6 +607,11 @@ class GenericCrawler:
             MetadataClassNotFoundError: Metadata class not found.
         """
 
+        try:
+            return cls._metadata_classes[name]  # type: ignore[return-value]
+        except KeyError:
+            pass
+
         # metadata classes are created dynamically during initialization and
         # assigned as class attributes where they can be retrieved here.
         metadata_class = getattr(cls, f'{cls.__name__}{name}Metadata', None)
@@ -361,6 +620,7 @@ class GenericCrawler:
                 f'Failed to find "{cls.__name__}{name}Metadata".'
             )
 
+        cls._metadata_classes[name] = metadata_class
         return metadata_class
 
     @classmethod
@@ -426,25 +686,30 @@ class GenericCrawler:
         try:
             # run scan
             logger.trace(  # type: ignore
-                '%s is getting asyncify %s:%s',
+                '%s is paginating %s:%s',
                 cls.__name__,
                 context.name,
                 paginator.paginate.__name__,
             )  # type: ignore
-            pages: Iterable[dict[str, Any]] = await asyncify(
-                paginator.paginate, **cls.scanParameters
-            )
 
-            # create new class instance for each resource found and add to scan_results
-            for resource in (
-                resource for page in pages for resource in page[cls.resourceType]
-            ):
-                resource_instance: GenericCrawler = cls(
-                    context=context, metadata=resource
-                )
-                scan.scan_results[cls.serviceType][cls.resourceName].update(
-                    {resource_instance.id: resource_instance}
+            # create new class instance for each resource found and add to scan_results,
+            # as each page is retrieved
+            resources = scan.scan_results[cls.serviceType][cls.resourceName]
+            resource_type = cls.resourceType
+            pages = paginator.paginate(**cls.scanParameters)
+            if not hasattr(pages, '__aiter__'):
+                if asyncio.iscoroutine(pages):
+                    pages.close()
+                raise FailedCrawlerScanError(
+                    f'Failed scan of {context.name}:{cls.resourceName} - '
+                    f'{type(paginator).__name__}.paginate must be an async generator.'
                 )
+            async for page in pages:
+                for resource in page[resource_type]:
+                    resource_instance: GenericCrawler = cls(
+                        context=context, metadata=resource
+                    )
+                    resources[resource_instance.id] = resource_instance
 
         except ParamValidationError as err:
             raise FailedCrawlerScanError(
@@ -487,9 +752,16 @@ class GenericCrawler:
 
         contexts = tuple([scan.CONTEXTS[0]]) if cls.globalService else scan.CONTEXTS
 
+        # bound concurrent contexts to stay within the client connection pools
+        semaphore = asyncio.Semaphore(CONTEXT_CONCURRENCY)
+
+        async def scan_context(context: CONTEXT) -> None:
+            async with semaphore:
+                await cls._scan_context(context)
+
         await asyncio.gather(
             *(
-                cls._scan_context(context)
+                scan_context(context)
                 for context in contexts
                 if context.service == cls.serviceType
             )
@@ -519,7 +791,7 @@ class GenericCrawler:
                 'region': self.context.region,
                 'session': self.context.service,
             },
-            'data': asdict(self.__metadata__),
+            'data': self.__metadata__.asdict(),
         }
 
         return data
@@ -527,12 +799,20 @@ class GenericCrawler:
     def asjson(self) -> str:
         """Return crawler data as json string.
 
-        Returns json string representation of crawler instance.
+        Returns json string representation of crawler instance. Uses `orjson`
+        if installed.
 
         Returns:
             JSON string of attributes.
         """
 
+        if orjson is not None:
+            # datetimes are passed to str() to match the json module output
+            return orjson.dumps(
+                self.asdict(),
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
         return json.dumps(self.asdict(), default=str)
 
     def __eq__(self, __o: object) -> bool:
@@ -541,16 +821,21 @@ class GenericCrawler:
         return str(__o) == self.id
 
     def __delattr__(self, __key: str) -> None:
-        if self._frozen:
+        if getattr(self, '_frozen', False):
             raise FrozenInstanceError(f"cannot delete field '{__key}'")
         object.__delattr__(self, __key)
 
     def __setattr__(self, __key: str, __val: Any) -> None:
-        if self._frozen:
+        if getattr(self, '_frozen', False):
             raise FrozenInstanceError(f"cannot assign to field '{__key}'")
         object.__setattr__(self, __key, __val)
 
     def __getattr__(self, __attr) -> GenericMetadata:
+        # unset slots must not fall through to metadata lookup
+        if __attr in GenericCrawler.__slots__:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{__attr}'"
+            )
         try:
             return getattr(self.__metadata__, __attr)
         except AttributeError:
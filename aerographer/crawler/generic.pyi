@@ -16,17 +16,25 @@ limitations under the License.
 """Type stub file"""
 
 from abc import ABC
+from threading import Lock, RLock
 from types import FunctionType
-from typing import Any, Callable, Generator, Protocol
+from typing import Any, AsyncIterator, Callable, Generator
 
 import aerographer.scan as scan
 from aerographer.scan.context import CONTEXT
+from aerographer.evaluations import Result
+
+_EVALUATION_LOCKS_GUARD: Lock
 
 class PaginateWrapper:
     func: FunctionType
 
     def __init__(self, func: FunctionType, page_marker:str) -> None: ...
     def paginate(self, **kwargs: Any) -> Generator[dict[str, Any], Any, Any]: ...
+    def apaginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]: ...
+    def _resolve_marker(
+        self, page: dict[str, Any]
+    ) -> tuple[str, Callable[[dict[str, Any]], bool]] | None: ...
 
 class GenericCustomPaginator(ABC):
     INCLUDE: set[str]
@@ -36,12 +44,35 @@ class GenericCustomPaginator(ABC):
     paginator: Callable[..., Any]
 
     def __init__(self, context: CONTEXT, paginator_func_name: str, page_marker: str) -> None: ...
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]: ...
+    def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]: ...
+
+class GenericMetadata:
+    __metadata_fields__: tuple[str, ...]
+    __metadata_field_set__: frozenset[str]
+    __metadata_child_paths__: dict[str, str]
+
+    def asdict(self) -> dict[str, Any]: ...
+    def __eq__(self, __o: object) -> bool: ...
+    def __hash__(self) -> int: ...
+    def __repr__(self) -> str: ...
+    def __delattr__(self, __key: str) -> None: ...
+    def __setattr__(self, __key: str, __val: Any) -> None: ...
+    def __getstate__(self) -> tuple[Any, ...]: ...
+    def __setstate__(self, state: tuple[Any, ...]) -> None: ...
 
-class GenericMetadata(Protocol):
-    __dataclass_fields__: dict[str, Any]
+def _metadata_values(metadata: GenericMetadata) -> tuple[Any, ...]: ...
+def _metadata_asdict(value: Any) -> Any: ...
 
 class GenericCrawler:
+    __slots__ = (
+        '__metadata__',
+        'context',
+        'results',
+        '_results_index',
+        '_evaluation_locks',
+        'id',
+        '_frozen',
+    )
     state: str
     evaluations: tuple[str, ...]
     custom_paginator: GenericCustomPaginator
@@ -53,16 +84,26 @@ class GenericCrawler:
     page_marker: str
     scanParameters: dict[str, Any]
     idAttribute: str
+    _include_key: str
+    _metadata_classes: dict[str, type]
+    _evaluation_table: dict[str, tuple[Callable[..., Any], bool]]
     context: CONTEXT
     id: str
     results: list[tuple[str, str, bool]]
+    _results_index: dict[str, Result]
+    _evaluation_locks: dict[str, RLock]
     passed: bool
     __name__: str
     __metadata__: GenericMetadata
+    _frozen: bool
 
+    def __init_subclass__(cls, **kwargs: Any) -> None: ...
+    @classmethod
+    def _build_evaluation_table(cls) -> None: ...
     def __init__(self, context: CONTEXT, metadata: dict[str, Any]) -> None: ...
     def _set_id(self) -> None: ...
     def evaluate(self, evaluation: str, survey) -> bool: ...
+    def _evaluate(self, evaluation: str, survey) -> bool: ...
     def run_evaluations(self, survey) -> None: ...
     def _build_metadata(
         self, metadata: dict[str, Any] | list[Any] | Any, path: str = ...
@@ -18,7 +18,6 @@ limitations under the License.
 Contains classes and decorators related to custom built evaluations
 for web crawler classes.
 """
-from functools import wraps
 from typing import Any, Callable
 from dataclasses import dataclass, field
 
@@ -44,7 +43,8 @@ def evaluation(
 ) -> Callable[..., Any]:
     """Evaluation decorator.
 
-    Decorator for evalutions to set custom function attributes.
+    Decorator for evalutions to set custom function attributes. The
+    decorated function is returned as is, without a wrapper.
 
     Args:
         service (str): Value to set for __service__ attribute.
@@ -63,12 +63,6 @@ def evaluation(
         setattr(func, '__service__', service)
         setattr(func, '__resource__', resource)
         setattr(func, '__includes__', includes)
-
-        @wraps(func)
-        def wrapper(*args: list[Any], **kwargs: dict[str, Any]) -> Any:
-            result = func(*args, **kwargs)
-            return result
-
-        return wrapper
+        return func
 
     return decorator
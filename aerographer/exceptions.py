@@ -83,5 +83,5 @@ class SurveySearchQueryError(Exception):
     """Error with survery query search encountered."""
 
 
-class FrozenInstanceError(Exception):
+class FrozenInstanceError(AttributeError):
     """Frozen crawler setattr encountered."""
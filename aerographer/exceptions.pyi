@@ -31,4 +31,4 @@ class FailedCrawlerScanError(Exception): ...
 class TimeOutCrawlerScanError(Exception): ...
 class SurveyAttributeError(Exception): ...
 class SurveySearchQueryError(Exception): ...
-class FrozenInstanceError(Exception): ...
\ No newline at end of file
+class FrozenInstanceError(AttributeError): ...
\ No newline at end of file
@@ -35,7 +35,7 @@ from aerographer.scan.context import (
     get_caller_id,
 )
 from aerographer.logger import logger
-from aerographer.config import ACCOUNTS
+from aerographer.config import ACCOUNT, ACCOUNTS
 
 
 scan_results: dict[str, Any] = {}
@@ -70,7 +70,7 @@ def _init_session(profile: str, region: str, role: str) -> SESSION:
     return SESSION(region=session.region_name, session=session)
 
 
-def _init_service_contexts(session: SESSION, services: set[str]) -> list[CONTEXT]:
+def _init_service_contexts(session: SESSION, services: set[str] | frozenset[str]) -> list[CONTEXT]:
     caller_id = get_caller_id(session.session)
     """Create a collection scan contexts for the context and services provided.
 
@@ -80,7 +80,7 @@ def _init_service_contexts(session: SESSION, services: set[str]) -> list[CONTEXT
     Args:
         session (SESSION): `SESSION` instance to use for creating
             `CONTEXT` instances.
-        services (set[str]): Set of services to use for creating
+        services (set[str] | frozenset[str]): Set of services to use for creating
             `CONTEXT` instances.
 
     Return:
@@ -109,16 +109,14 @@ def _init_service_contexts(session: SESSION, services: set[str]) -> list[CONTEXT
     return contexts
 
 
-async def _init_sessions(
-    accounts: list[dict[str, Any]] = ACCOUNTS
-) -> tuple[SESSION, ...]:
+async def _init_sessions(accounts: list[ACCOUNT] = ACCOUNTS) -> tuple[SESSION, ...]:
     """Create scan sessions.
 
     Creates a collection of `SESSION` instances using list of account
     properties provided.
 
     Args:
-        accounts (list[dict]): List of account properties to use for creating
+        accounts (list[ACCOUNT]): List of accounts to use for creating
             `SESSION` instances.
 
     Return:
@@ -129,16 +127,16 @@ async def _init_sessions(
     return tuple(
         await asyncio.gather(
             *(
-                asyncify(_init_session, account['profile'], region, account['role'])
+                asyncify(_init_session, account.profile, region, account.role)
                 for account in accounts
-                for region in account['regions']
+                for region in account.regions
             )
         )
     )
 
 
 async def _init_contexts(
-    sessions: tuple[SESSION, ...], services: set[str]
+    sessions: tuple[SESSION, ...], services: set[str] | frozenset[str]
 ) -> tuple[CONTEXT, ...]:
     """Create scan contexts.
 
@@ -148,7 +146,7 @@ async def _init_contexts(
     Args:
         sessions (tuple): List of `SESSION` instances to use for creating
             `CONTEXT` instances.
-        services (set[str]): Set of services to use for creating
+        services (set[str] | frozenset[str]): Set of services to use for creating
             `CONTEXT` instances.
 
     Return:
@@ -169,14 +167,14 @@ async def _init_contexts(
     )
 
 
-def build_contexts(accounts: list[dict[str, Any]], services: set[str]) -> None:
+def build_contexts(accounts: list[ACCOUNT], services: set[str] | frozenset[str]) -> None:
     """Initializes scan contexts.
 
     Initializes contexts for current scan.
 
     Args:
-        accounts (list[dict]): List of account properties to use for initialization.
-        services (set[str]): Set of services to use for initialization.
+        accounts (list[ACCOUNT]): List of accounts to use for initialization.
+        services (set[str] | frozenset[str]): Set of services to use for initialization.
 
     Return:
         Tuple containing created `CONTEXT` instances.
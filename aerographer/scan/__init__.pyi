@@ -16,6 +16,7 @@ limitations under the License.
 """Type stub file"""
 
 from typing import Any
+from aerographer.config import ACCOUNT
 from aerographer.scan.context import SESSION, CONTEXT
 from aerographer.crawler.generic import GenericCrawler
 
@@ -24,6 +25,6 @@ CONTEXTS: tuple[CONTEXT, ...]
 
 def _init_session(profile:str, region:str, role:str) -> SESSION: ...
 def _init_service_contexts(session:SESSION, services:set[str]) -> list[CONTEXT]: ...
-async def _init_sessions(accounts: list[dict[str, Any]] = ...) -> tuple[SESSION, ...]: ...
-async def _init_contexts(sessions: tuple[SESSION, ...], services: set[str]) -> tuple[CONTEXT, ...]: ...
-def build_contexts(accounts: list[dict[str, Any]], services: set[str]) -> tuple[CONTEXT, ...]: ...
+async def _init_sessions(accounts: list[ACCOUNT] = ...) -> tuple[SESSION, ...]: ...
+async def _init_contexts(sessions: tuple[SESSION, ...], services: set[str] | frozenset[str]) -> tuple[CONTEXT, ...]: ...
+def build_contexts(accounts: list[ACCOUNT], services: set[str] | frozenset[str]) -> tuple[CONTEXT, ...]: ...
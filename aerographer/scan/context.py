@@ -23,12 +23,22 @@ for external use.
 
 import sys
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
-import boto3  # type: ignore
+from botocore.config import Config  # type: ignore
 from botocore.exceptions import ProfileNotFound, NoCredentialsError, NoRegionError, ClientError, EndpointConnectionError  # type: ignore
 
 from aerographer.logger import logger
+from aerographer.config import MAX_POOL_CONNECTIONS, MAX_ATTEMPTS
+
+if TYPE_CHECKING:
+    import boto3  # type: ignore
+
+# shared by all clients, contexts are scanned concurrently
+_CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    retries={'max_attempts': MAX_ATTEMPTS, 'mode': 'adaptive'},
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -43,7 +53,7 @@ class SESSION:
     """
 
     region: str
-    session: boto3.Session
+    session: 'boto3.Session'
 
 
 @dataclass(frozen=True, slots=True)
@@ -65,10 +75,10 @@ class CONTEXT:
     region: str
     service: str
     client: type
-    session: boto3.Session
+    session: 'boto3.Session'
 
 
-def get_session(region: str, profile: str | None = None) -> boto3.Session:
+def get_session(region: str, profile: str | None = None) -> 'boto3.Session':
     """Get a boto3 session.
 
     Returns a boto3 session using provided profile and region.
@@ -81,6 +91,8 @@ def get_session(region: str, profile: str | None = None) -> boto3.Session:
         boto3 session.
     """
 
+    import boto3  # type: ignore
+
     try:
         logger.trace('Building boto3 session for %s - %s.', profile, region)  # type: ignore
         return boto3.Session(profile_name=profile, region_name=region)
@@ -89,7 +101,7 @@ def get_session(region: str, profile: str | None = None) -> boto3.Session:
         sys.exit(1)
 
 
-def assume_role(session: boto3.Session, role_arn: str) -> boto3.Session:
+def assume_role(session: 'boto3.Session', role_arn: str) -> 'boto3.Session':
     """Get a boto3 session from assuming the provided role.
 
     Returns a boto3 session that has assumed the provided role.
@@ -120,6 +132,8 @@ def assume_role(session: boto3.Session, role_arn: str) -> boto3.Session:
 
     credentials = assumed_role_object['Credentials']
 
+    import boto3  # type: ignore
+
     logger.trace('Building boto3 session with STS credentials.')  # type: ignore
     return boto3.Session(
         aws_access_key_id=credentials['AccessKeyId'],
@@ -128,7 +142,7 @@ def assume_role(session: boto3.Session, role_arn: str) -> boto3.Session:
     )
 
 
-def get_client(service: str, session: boto3.Session = boto3.Session) -> Any:
+def get_client(service: str, session: 'boto3.Session | None' = None) -> Any:
     """Get a boto3 service client.
 
     Returns a boto3 client instance if the requested service
@@ -136,12 +150,16 @@ def get_client(service: str, session: boto3.Session = boto3.Session) -> Any:
 
     Args:
         service (str): Service to get client for.
-        session (boto3.Session): Session to use to get client.
+        session (boto3.Session): (Optional) Session to use to get client. Defaults
+            to a new default session.
 
     Return:
         boto3 client.
     """
 
+    if session is None:
+        session = get_session(region=None)  # type: ignore[arg-type]
+
     try:
         logger.trace(  # type: ignore
             'Building boto3 client for %s with Session(profile_name=%s, region_name=%s).',
@@ -149,13 +167,13 @@ def get_client(service: str, session: boto3.Session = boto3.Session) -> Any:
             session.profile_name,
             session.region_name,
         )
-        return session.client(service_name=service)
+        return session.client(service_name=service, config=_CLIENT_CONFIG)
     except NoRegionError as err:
         logger.error(err)
         sys.exit(1)
 
 
-def get_caller_id(session: boto3.Session) -> dict[str, str]:
+def get_caller_id(session: 'boto3.Session') -> dict[str, str]:
     """Get caller identity.
 
     Queries the AWS STS endpoint using the provided session
@@ -19,6 +19,9 @@ from typing import Any
 from dataclasses import dataclass
 
 import boto3  # type:ignore
+from botocore.config import Config  # type:ignore
+
+_CLIENT_CONFIG: Config
 
 @dataclass
 class SESSION:
@@ -36,5 +39,5 @@ class CONTEXT:
 
 def get_session(profile: str, region: str) -> boto3.Session: ...
 def assume_role(session: boto3.Session, role_arn: str) -> boto3.Session: ...
-def get_client(service: str, session: boto3.Session = ...) -> Any: ...
+def get_client(service: str, session: boto3.Session | None = ...) -> Any: ...
 def get_caller_id(session: boto3.Session) -> dict[str, str]: ...
@@ -23,7 +23,7 @@ use.
 import time
 import inspect
 import asyncio
-from typing import Any, Callable, Coroutine, Iterable
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterable
 
 from botocore.exceptions import ClientError  # type: ignore
 
@@ -35,6 +35,19 @@ from aerographer.exceptions import (
     FailedCrawlerScanError,
 )
 
+# error codes AWS APIs use for rate limiting
+_THROTTLING_ERROR_CODES = frozenset(
+    {
+        'Throttling',
+        'ThrottlingException',
+        'RequestLimitExceeded',
+        'TooManyRequestsException',
+    }
+)
+
+# sentinel returned by `next` once a page iterator is exhausted
+_PAGES_DONE = object()
+
 
 async def asyncify(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
     """Run function ansyncronously.
@@ -161,14 +174,18 @@ async def async_paginate(
             logger.trace('Resolving pages for %s.%s.', paginator.context, paginator.function)  # type: ignore
             pages = await asyncio.gather(*pages_iterables)
         except ClientError as err:
-            if err.response['Error']['Code'] == 'Throttling':
+            if err.response['Error']['Code'] in _THROTTLING_ERROR_CODES:
                 logger.trace('Coroutine queue size: %s', len(asyncio.all_tasks()))  # type: ignore
+                # no back off after the last attempt, it fails regardless
+                if attempt == 3:
+                    break
                 logger.warning(
                     'Pagination for %s.%s call limit exceeded; backing off and retrying...',
                     paginator.context,
                     paginator.function,
                 )
-                time.sleep((attempt + 1) * 30)
+                # linear backoff, without blocking other scans
+                await asyncio.sleep((attempt + 1) * 30)
                 continue
             raise
 
@@ -180,6 +197,35 @@ async def async_paginate(
     )
 
 
+async def async_stream(paginator: Any, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
+    """Stream pages asyncronously.
+
+    Runs the paginator provided in an asyncio thread one page at a time,
+    yielding each page as soon as it is retrieved. Only the current page is
+    held in memory. Throttled calls are retried by the boto3 client.
+
+    Args:
+        paginator (Any): Paginator class to run.
+        **kwargs: (Optional) additional arguments to pass to paginator.
+
+    Return:
+        Async iterator of pages.
+
+    Raises:
+        Boto3.ClientError: Pagination failed.
+    """
+
+    logger.debug('Streaming pages for %s.%s.', paginator.context, paginator.function)
+
+    page_iterator = iter(paginator.paginate(**kwargs))
+    while (
+        page := await asyncio.to_thread(next, page_iterator, _PAGES_DONE)
+    ) is not _PAGES_DONE:
+        yield page
+
+    logger.trace('Streaming pages for %s.%s complete.', paginator.context, paginator.function)  # type: ignore
+
+
 def _resolve_pages(
     page_iterator: Iterable[Any],
     context: str,
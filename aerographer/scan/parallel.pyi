@@ -15,7 +15,10 @@ limitations under the License.
 
 """Type stub file"""
 
-from typing import Any, Awaitable, Callable, Iterable
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+
+_THROTTLING_ERROR_CODES: frozenset[str]
+_PAGES_DONE: object
 
 async def asyncify(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any: ...
 async def async_scan(cls: Any) -> Awaitable[Any]: ...
@@ -25,6 +28,7 @@ async def async_paginate(
     id_values: Iterable[Any] | None = ...,
     **kwargs: Any
 ) -> tuple[list[dict[str, Any]], ...]: ...
+def async_stream(paginator: Any, **kwargs: Any) -> AsyncIterator[dict[str, Any]]: ...
 def _resolve_pages(
     page_iterator: Iterable[Any],
     context: str,
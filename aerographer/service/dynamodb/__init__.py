@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 from aerographer.scan import scan_results
 from aerographer.scan.parallel import async_paginate
 from aerographer.crawler import get_crawlers, deploy_crawlers
@@ -42,7 +42,7 @@ class TableIdPaginator(GenericCustomPaginator):
         paginate(**kwargs): Retrieve data.
     """
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -51,21 +51,17 @@ class TableIdPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
-        pages: list[Any] = []
-
         results = await async_paginate(paginator=self.paginator, **kwargs)
 
         for result in results:
             for page in result:
                 page_new: dict[str, list[dict[str, str]]] = {}
                 page_new["TableNames"] = [{"TableId": r} for r in page["TableNames"]]
-                pages.append(page_new)
-
-        return tuple(pages)
+                yield page_new
 
 
 class TablePaginator(GenericCustomPaginator):
@@ -84,7 +80,7 @@ class TablePaginator(GenericCustomPaginator):
 
     INCLUDE = {'dynamodb.table_id'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -93,15 +89,14 @@ class TablePaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['dynamodb']['table_id'].values():
-            return tuple(pages)
+            return
 
         tables: list[str] = [
             i.id
@@ -120,6 +115,4 @@ class TablePaginator(GenericCustomPaginator):
             for page in result:
                 new_page['Table'].append(page['Table'])
 
-        pages.append(new_page)
-
-        return tuple(pages)
+        yield new_page
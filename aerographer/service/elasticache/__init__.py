@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 from aerographer.scan import scan_results
 from aerographer.scan.parallel import async_paginate
 from aerographer.crawler import get_crawlers, deploy_crawlers
@@ -45,7 +45,7 @@ class ReplicationGroupTagPaginator(GenericCustomPaginator):
 
     INCLUDE = {'elasticache.replication_group'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -60,10 +60,9 @@ class ReplicationGroupTagPaginator(GenericCustomPaginator):
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['elasticache']['replication_group'].values():
-            return tuple(pages)
+            return
 
         replication_groups = [
             i.ARN
@@ -87,6 +86,4 @@ class ReplicationGroupTagPaginator(GenericCustomPaginator):
             for page in result:
                 for tag in page['TagList']:
                     tag['ReplicationGroupId'] = group
-                pages.append(page)
-
-        return tuple(pages)
+                yield page
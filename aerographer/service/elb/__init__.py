@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 from aerographer.scan import scan_results
 from aerographer.scan.parallel import async_paginate
 from aerographer.crawler import get_crawlers, deploy_crawlers
@@ -45,7 +45,7 @@ class TagPaginator(GenericCustomPaginator):
 
     INCLUDE = {'elb.load_balancer'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -60,10 +60,9 @@ class TagPaginator(GenericCustomPaginator):
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['elb']['load_balancer'].values():
-            return tuple(pages)
+            return
 
         load_balancers: list[str] = [
             i.LoadBalancerName  # type: ignore
@@ -82,6 +81,4 @@ class TagPaginator(GenericCustomPaginator):
 
         for result in results:
             for page in result:
-                pages.append(page)
-
-        return tuple(pages)
+                yield page
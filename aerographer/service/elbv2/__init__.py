@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 from aerographer.scan import scan_results
 from aerographer.scan.parallel import async_paginate
 from aerographer.crawler import get_crawlers, deploy_crawlers
@@ -45,7 +45,7 @@ class TagPaginator(GenericCustomPaginator):
 
     INCLUDE = {'elbv2.load_balancer'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -54,15 +54,14 @@ class TagPaginator(GenericCustomPaginator):
             **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-            An iterable object. Iterating over this object will yield a single page of a
+            An async iterator. Iterating over this object will yield a single page of a
             response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['elbv2']['load_balancer'].values():
-            return tuple(pages)
+            return
 
         load_balancers: list[str] = [
             i.LoadBalancerArn  # type: ignore
@@ -78,6 +77,4 @@ class TagPaginator(GenericCustomPaginator):
 
         for result in results:
             for page in result:
-                pages.append(page)
-
-        return tuple(pages)
+                yield page
@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 import json
 import asyncio
 
@@ -45,7 +45,7 @@ class RolePaginator(GenericCustomPaginator):
        paginate(**kwargs): Retrieve data.
     """
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -54,12 +54,11 @@ class RolePaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         # list_roles is missing RoleLastUsed attribute, so get_role is required to get data
-        pages: list[dict[str, Any]] = []
         new_page: dict[str, list[dict[str, str]]] = {'Roles': []}
         roles: list[str] = []
 
@@ -87,9 +86,7 @@ class RolePaginator(GenericCustomPaginator):
                 )
                 new_page['Roles'].append(role['Role'])
 
-        pages.append(new_page)
-
-        return tuple(pages)
+        yield new_page
 
 
 class RolePolicyIdPaginator(GenericCustomPaginator):
@@ -108,7 +105,7 @@ class RolePolicyIdPaginator(GenericCustomPaginator):
 
     INCLUDE = {'iam.role'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -117,15 +114,14 @@ class RolePolicyIdPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['iam']['role'].values():
-            return tuple(pages)
+            return
 
         roles: list[str] = [
             i.id
@@ -152,9 +148,7 @@ class RolePolicyIdPaginator(GenericCustomPaginator):
                     page['PolicyNames'].append(
                         {'RoleName': role_name, 'PolicyName': policy}
                     )
-                pages.append(page)
-
-        return tuple(pages)
+                yield page
 
 
 class RolePolicyPaginator(GenericCustomPaginator):
@@ -173,7 +167,7 @@ class RolePolicyPaginator(GenericCustomPaginator):
 
     INCLUDE = {'iam.role_policy_id'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -182,15 +176,14 @@ class RolePolicyPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['iam']['role_policy_id'].values():
-            return tuple(pages)
+            return
 
         role_and_policy_names: list[dict[str, str]] = [
             {
@@ -224,8 +217,7 @@ class RolePolicyPaginator(GenericCustomPaginator):
                     del policy['ResponseMetadata']
                     new_page['RolePolicies'].append(policy)
 
-        pages.append(new_page)
-        return tuple(pages)
+        yield new_page
 
 
 class RoleAttachedPolicyPaginator(GenericCustomPaginator):
@@ -244,7 +236,7 @@ class RoleAttachedPolicyPaginator(GenericCustomPaginator):
 
     INCLUDE = {'iam.role'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -253,15 +245,14 @@ class RoleAttachedPolicyPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['iam']['role'].values():
-            return tuple(pages)
+            return
 
         roles: list[str] = [
             role.id
@@ -285,9 +276,7 @@ class RoleAttachedPolicyPaginator(GenericCustomPaginator):
             for page in page_result:
                 for policy in page['AttachedPolicies']:
                     policy['RoleName'] = role_name
-                pages.append(page)
-
-        return tuple(pages)
+                yield page
 
 
 class PolicyDocumentPaginator(GenericCustomPaginator):
@@ -306,7 +295,7 @@ class PolicyDocumentPaginator(GenericCustomPaginator):
 
     INCLUDE = {'iam.policy'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -315,15 +304,14 @@ class PolicyDocumentPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['iam']['policy'].values():
-            return tuple(pages)
+            return
 
         policies: list[dict[str, str]] = [
             {
@@ -368,9 +356,7 @@ class PolicyDocumentPaginator(GenericCustomPaginator):
                         {'PolicyName': policy_id, **document['PolicyVersion']}
                     )
 
-        pages.append(page)
-
-        return tuple(pages)
+        yield page
 
 
 class ManagedPolicyDocumentPaginator(GenericCustomPaginator):
@@ -389,7 +375,7 @@ class ManagedPolicyDocumentPaginator(GenericCustomPaginator):
 
     INCLUDE = {'iam.managed_policy'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -398,15 +384,14 @@ class ManagedPolicyDocumentPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['iam']['managed_policy'].values():
-            return tuple(pages)
+            return
 
         policies: list[dict[str, str]] = [
             {
@@ -451,6 +436,4 @@ class ManagedPolicyDocumentPaginator(GenericCustomPaginator):
                         {'PolicyName': policy_id, **document['PolicyVersion']}
                     )
 
-        pages.append(page)
-
-        return tuple(pages)
+        yield page
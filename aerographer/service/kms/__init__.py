@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 from aerographer.scan import scan_results
 from aerographer.scan.parallel import async_paginate
 from aerographer.crawler import get_crawlers, deploy_crawlers
@@ -44,7 +44,7 @@ class KeyPaginator(GenericCustomPaginator):
 
     INCLUDE = {'kms.key_id'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -53,7 +53,7 @@ class KeyPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
@@ -65,7 +65,6 @@ class KeyPaginator(GenericCustomPaginator):
         ]
 
         ## return a single page with multiple results
-        pages: list[dict[str, Any]] = []
         page: dict[str, list[dict[str, str]]] = {'KeyMetadata': []}
 
         for results in await async_paginate(
@@ -73,9 +72,7 @@ class KeyPaginator(GenericCustomPaginator):
         ):
             for result in results:
                 page['KeyMetadata'].append(result['KeyMetadata'])
-        pages.append(page)
-
-        return tuple(pages)
+        yield page
 
 
 class KeyRotationPaginator(GenericCustomPaginator):
@@ -94,7 +91,7 @@ class KeyRotationPaginator(GenericCustomPaginator):
 
     INCLUDE = {'kms.key'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -103,15 +100,14 @@ class KeyRotationPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['kms']['key'].values():
-            return tuple(pages)
+            return
 
         keys: list[str] = [
             i.id
@@ -138,6 +134,4 @@ class KeyRotationPaginator(GenericCustomPaginator):
                 page["KeyRotation"].append(
                     {'KeyId': key, 'KeyRotationEnabled': result['KeyRotationEnabled']}
                 )
-        pages.append(page)
-
-        return tuple(pages)
+        yield page
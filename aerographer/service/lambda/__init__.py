@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 from aerographer.scan.parallel import async_paginate
 from aerographer.crawler.generic import GenericCustomPaginator
 
@@ -41,7 +41,7 @@ class FunctionPaginator(GenericCustomPaginator):
         paginate(**kwargs): Retrieve data.
     """
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -50,12 +50,10 @@ class FunctionPaginator(GenericCustomPaginator):
             **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-            An iterable object. Iterating over this object will yield a single page of a
+            An async iterator. Iterating over this object will yield a single page of a
             response at a time.
         """
 
-        pages: list[Any] = []
-
         results = await async_paginate(paginator=self.paginator, **kwargs)
 
         for result in results:
@@ -68,6 +66,4 @@ class FunctionPaginator(GenericCustomPaginator):
                         ]
                     except KeyError:
                         continue
-                pages.append(page)
-
-        return tuple(pages)
+                yield page
@@ -18,7 +18,7 @@ limitations under the License.
 Contains any customer paginators for service.
 """
 
-from typing import Any
+from typing import Any, AsyncIterator
 from aerographer.scan import scan_results
 from aerographer.scan.parallel import async_paginate
 from aerographer.crawler import get_crawlers, deploy_crawlers
@@ -44,7 +44,7 @@ class RecordSetPaginator(GenericCustomPaginator):
 
     INCLUDE = {'route53.hosted_zone'}
 
-    async def paginate(self, **kwargs: Any) -> tuple[dict[str, Any], ...]:
+    async def paginate(self, **kwargs: Any) -> AsyncIterator[dict[str, Any]]:
         """Retrieves pages of resource data.
 
         Retrieves list of pages for resource data.
@@ -53,15 +53,14 @@ class RecordSetPaginator(GenericCustomPaginator):
            **kwargs: any arguements supported by function provided through paginate_func_name
 
         Returns:
-           An iterable object. Iterating over this object will yield a single page of a
+           An async iterator. Iterating over this object will yield a single page of a
            response at a time.
         """
 
         await deploy_crawlers(get_crawlers(services=self.INCLUDE))
-        pages: list[dict[str, Any]] = []
 
         if not scan_results['route53']['hosted_zone'].values():
-            return tuple(pages)
+            return
 
         zones: list[str] = [
             i.id
@@ -90,6 +89,4 @@ class RecordSetPaginator(GenericCustomPaginator):
                     page['ResourceRecordSets'].append(
                         record | {'HostedZoneId': zone_id, 'Id': record_id}
                     )
-        pages.append(page)
-
-        return tuple(pages)
+        yield page
@@ -31,7 +31,7 @@ with scan results.
 import string
 import re
 import itertools
-from typing import Any, Iterable, Callable, Generator
+from typing import Any, Iterable, Callable
 from collections.abc import Generator
 
 from aerographer.crawler.generic import GenericCrawler
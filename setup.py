@@ -5,6 +5,7 @@ setup(
     version='0.0.1',
     python_requires='>=3.10',
     install_requires=['boto3 >=1.21.0'],
+    extras_require={'orjson': ['orjson >=3.0.0']},
     package_data={'aerographer': ['*.py', '*.,pyi', '**/*.py', '**/*.pyi']},
     packages=find_packages(exclude=['tests'])
 )